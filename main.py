@@ -16,10 +16,12 @@ import uvloop
 
 from src.commands.app.cmd import (
     autocomplete_app_cmd,
+    clear_identity_caches,
     cmd_app_delete,
     cmd_app_info,
     cmd_app_scope,
     cmd_app_search,
+    invalidate_local_command_cache,
 )
 from src.commands.app.exec import cmd_app_exec
 from src.commands.debug.download import cmd_debug_download
@@ -38,7 +40,11 @@ from src.commands.utils import hook_cmd_group, hook_cmd_subgroup
 from src.container.app import get_arc, init_app
 from src.container.types import ModuleType
 from src.modules.registry import registry
-from src.shared.constants import EXTENSIONS_DIR, SHUTDOWN_EVENT, TOKEN
+from src.shared.constants import (
+    EXTENSIONS_DIR,
+    SHUTDOWN_EVENT,
+    TOKEN,
+)
 from src.shared.error import error_handler
 from src.shared.logger import logger
 from src.shared.utils.client import make_arc_client, make_hikari_client
@@ -48,15 +54,9 @@ from src.shared.utils.package import import_package
 if typing.TYPE_CHECKING:
     from src.shared.utils.jurigged import Jurigged
 
+_DiscoveredModule = tuple[str, str, bool]
 
-def _install_uvloop() -> None:
-    if sys.platform == "win32":
-        return
-    with contextlib.suppress(Exception):
-        uvloop.install()
-
-
-_install_uvloop()
+_STARTUP_LOAD_CONCURRENCY: typing.Final[int] = 4
 
 _token_value = (TOKEN or "").strip()
 if not _token_value:
@@ -90,6 +90,7 @@ async def error_handler_wrapper(
 
 @hikari_client.listen()
 async def on_hikari_starting(event: hikari.StartingEvent) -> None:
+    clear_identity_caches()
     logger.info("Processing starting hikari event for %s", type(event.app).__name__)
     logger.info("Starting hikari client %s", event.app)
 
@@ -116,64 +117,116 @@ async def on_hikari_started(event: hikari.StartedEvent) -> None:
         logger.exception("Failed to complete bot startup")
 
 
+def _scan_extensions() -> set[_DiscoveredModule]:
+    discovered_modules: set[_DiscoveredModule] = set()
+    with os.scandir(EXTENSIONS_DIR) as entries:
+        for entry in entries:
+            entry_name: str = entry.name
+            if entry_name.startswith(".") or entry_name == "__pycache__":
+                continue
+
+            if (
+                entry.is_file()
+                and entry_name.endswith(".py")
+                and not entry_name.startswith("_")
+            ):
+                short_name: str = entry_name[:-3]
+                discovered_modules.add((f"extensions.{short_name}", short_name, False))
+                continue
+
+            if entry.is_dir():
+                entry_path: pathlib.Path = EXTENSIONS_DIR / entry_name
+                if (entry_path / ModuleType.PYTHON.entry_file).is_file():
+                    discovered_modules.add(
+                        (f"extensions.{entry_name}.main", entry_name, True),
+                    )
+    return discovered_modules
+
+
+def _discover_extensions() -> tuple[_DiscoveredModule, ...]:
+    return tuple(
+        module
+        for _, module in sorted(
+            (module[0].casefold(), module) for module in _scan_extensions()
+        )
+    )
+
+
+async def _load_extension_module(
+    client: arc.client.GatewayClient,
+    semaphore: asyncio.Semaphore,
+    module_path: str,
+    short_name: str,
+    *,
+    is_dynamic: bool,
+) -> bool:
+    async with semaphore:
+        if is_dynamic:
+            return await registry.load_module(hikari_client, short_name)
+
+        client.load_extension(module_path)
+        logger.info("Loaded module '%s'", module_path)
+        return True
+
+
 @arc_client.add_startup_hook
 async def on_arc_starting(client: arc.client.GatewayClient) -> None:
     global jurigged_service
 
-    discovered_modules: set[str] = set()
+    extension_modules: tuple[_DiscoveredModule, ...] = ()
     try:
-        with os.scandir(EXTENSIONS_DIR) as entries:
-            for entry in entries:
-                entry_name: str = entry.name
-                if entry_name.startswith(".") or entry_name == "__pycache__":
-                    continue
-
-                if (
-                    entry.is_file()
-                    and entry_name.endswith(".py")
-                    and not entry_name.startswith("_")
-                ):
-                    discovered_modules.add(f"extensions.{entry_name[:-3]}")
-                    continue
-
-                if entry.is_dir():
-                    entry_path: pathlib.Path = EXTENSIONS_DIR / entry_name
-                    if (entry_path / ModuleType.PYTHON.entry_file).is_file():
-                        discovered_modules.add(f"extensions.{entry_name}.main")
+        extension_modules = await asyncio.to_thread(_discover_extensions)
     except FileNotFoundError:
         logger.info("Extensions directory not found: %s", EXTENSIONS_DIR)
     except OSError:
         logger.exception("Failed to discover extensions directory")
 
-    extension_modules: tuple[str, ...] = tuple(
-        sorted(discovered_modules, key=str.casefold)
-    )
     logger.info("Discovered %d modules", len(extension_modules))
 
     if extension_modules:
-        logger.info("Loading modules: %s", list(extension_modules))
+        logger.info(
+            "Loading modules: %s",
+            [module_path for module_path, _, _ in extension_modules],
+        )
         loaded: set[str] = set()
         failed: set[str] = set()
-
-        for extension_module in extension_modules:
-            if extension_module.endswith(".main"):
-                module_name = extension_module.split(".")[-2]
+        semaphore = asyncio.Semaphore(_STARTUP_LOAD_CONCURRENCY)
+        event_loop = asyncio.get_running_loop()
+
+        results: list[bool | BaseException] = await asyncio.gather(
+            *(
+                asyncio.eager_task_factory(
+                    event_loop,
+                    _load_extension_module(
+                        client,
+                        semaphore,
+                        module_path,
+                        short_name,
+                        is_dynamic=is_dynamic,
+                    ),
+                )
+                for module_path, short_name, is_dynamic in extension_modules
+            ),
+            return_exceptions=True,
+        )
+        for (module_path, _, _), result in zip(
+            extension_modules,
+            results,
+            strict=True,
+        ):
+            if isinstance(result, asyncio.CancelledError):
+                raise result
+            if isinstance(result, BaseException):
+                logger.exception(
+                    "Failed to load module '%s'",
+                    module_path,
+                    exc_info=result,
+                )
+                failed.add(module_path)
+            elif result:
+                loaded.add(module_path)
             else:
-                module_name = extension_module.split(".")[-1]
-
-            try:
-                if extension_module.endswith(".main"):
-                    if await registry.load_module(hikari_client, module_name):
-                        loaded.add(extension_module)
-                    else:
-                        failed.add(extension_module)
-                else:
-                    client.load_extension(extension_module)
-                    logger.info("Loaded module '%s'", extension_module)
-                    loaded.add(extension_module)
-            except Exception:
-                logger.exception("Failed to load module '%s'", extension_module)
-                failed.add(extension_module)
+                failed.add(module_path)
 
         logger.info("Loaded %d modules", len(loaded))
         logger.info("Failed to load %d modules", len(failed))
@@ -184,6 +237,7 @@ async def on_arc_starting(client: arc.client.GatewayClient) -> None:
         await client.resync_commands()
     except Exception:
         logger.exception("Failed to resync application commands")
+    invalidate_local_command_cache()
 
     if jurigged_service is None:
         try:
@@ -431,7 +485,10 @@ async def cmd_module_load_wrapper(
         ),
     ],
 ) -> None:
-    await cmd_module_load(ctx, url)
+    try:
+        await cmd_module_load(ctx, url)
+    finally:
+        invalidate_local_command_cache()
 
 
 @cmd_module.include()
@@ -447,7 +504,10 @@ async def cmd_module_unload_wrapper(
         ),
     ],
 ) -> None:
-    await cmd_module_unload(ctx, module)
+    try:
+        await cmd_module_unload(ctx, module)
+    finally:
+        invalidate_local_command_cache()
 
 
 @cmd_module.include()
@@ -466,11 +526,22 @@ async def cmd_module_update_wrapper(
         ),
     ],
 ) -> None:
-    await cmd_module_update(ctx, module)
+    try:
+        await cmd_module_update(ctx, module)
+    finally:
+        invalidate_local_command_cache()
 
 
 _shutdown_started: bool = False
 _shutdown_lock = asyncio.Lock()
+_background_tasks: set[asyncio.Task[None]] = set()
+
+
+def _spawn(coro: typing.Coroutine[typing.Any, typing.Any, None]) -> asyncio.Task[None]:
+    task: asyncio.Task[None] = asyncio.get_running_loop().create_task(coro)
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+    return task
 
 
 async def request_shutdown(reason: str) -> None:
@@ -515,7 +586,7 @@ async def main() -> None:
     event_loop.set_exception_handler(exception_handler)
 
     def dispatch_shutdown(signal_type: signal.Signals) -> None:
-        asyncio.create_task(request_shutdown(reason=f"Received {signal_type.name}"))
+        _spawn(request_shutdown(reason=f"Received {signal_type.name}"))
 
     for signal_type in (signal.SIGINT, signal.SIGTERM):
         with contextlib.suppress(NotImplementedError):
@@ -525,16 +596,9 @@ async def main() -> None:
                 signal_type,
             )
 
-    join_task: asyncio.Task[None] | None = None
-
     try:
         await hikari_client.start()
-
-        join_task = asyncio.create_task(hikari_client.join())
-        await join_task
-        join_error: BaseException | None = join_task.exception()
-        if join_error is not None:
-            logger.exception("Failed to join bot", exc_info=join_error)
+        await hikari_client.join()
         await request_shutdown("Bot connection closed")
     except asyncio.CancelledError:
         logger.info("Main runtime loop cancelled; requesting shutdown")
@@ -543,14 +607,11 @@ async def main() -> None:
         logger.exception("Failed to run bot")
         await request_shutdown("Runtime failure")
     finally:
-        cleanup_tasks: tuple[asyncio.Task[None], ...] = tuple(
-            task for task in (join_task,) if task is not None and not task.done()
+        pending_tasks: tuple[asyncio.Task[None], ...] = tuple(
+            task for task in _background_tasks if not task.done()
         )
-        for task in cleanup_tasks:
-            task.cancel()
-        for task in cleanup_tasks:
-            with contextlib.suppress(asyncio.CancelledError, Exception):
-                await task
+        if pending_tasks:
+            await asyncio.gather(*pending_tasks, return_exceptions=True)
 
         if jurigged_service is not None:
             with contextlib.suppress(Exception):
@@ -558,9 +619,16 @@ async def main() -> None:
             jurigged_service = None
 
 
+def _loop_factory() -> typing.Callable[[], asyncio.AbstractEventLoop] | None:
+    if sys.platform == "win32":
+        return None
+    return uvloop.new_event_loop
+
+
 def entrypoint() -> None:
     try:
-        asyncio.run(main())
+        with asyncio.Runner(loop_factory=_loop_factory()) as runner:
+            runner.run(main())
     except Exception:
         logger.exception("Failed to execute main application")
         sys.exit(1)
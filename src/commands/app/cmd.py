@@ -1,26 +1,49 @@
 from __future__ import annotations
 
-import pprint
+import asyncio
+import copy
+import datetime
+import functools
+import string
+import time
 from collections.abc import Mapping, Sequence, Sized
-from typing import TYPE_CHECKING, Protocol, runtime_checkable
+from typing import TYPE_CHECKING
 
 import hikari
+import orjson
 
 from src.container.app import get_arc, get_hikari
 from src.shared.logger import logger
 from src.shared.utils.view import defer, reply_embed, reply_err
-from thefuzz import process as fuzz_process
+
+try:
+    from rapidfuzz import fuzz, process as fuzz_process, utils as fuzz_utils
+except ImportError:
+    fuzz = fuzz_process = fuzz_utils = None
 
 if TYPE_CHECKING:
     import arc
 
 
 _MAX_CHOICES = 25
-
-
-@runtime_checkable
-class _SupportsToDict(Protocol):
-    def to_dict(self) -> object: ...
+_REMOTE_COMMANDS_TTL = 5.0
+_COMMAND_ATTR_NAMES = (
+    "_slash_commands",
+    "_message_commands",
+    "_user_commands",
+    "_commands",
+)
+_LEAF_TYPES: frozenset[type] = frozenset({str, int, float, bool, type(None)})
+_application_id: hikari.Snowflake | None = None
+_embed_templates: dict[str, hikari.Embed] = {}
+_command_attr_spec: tuple[tuple[str, bool], ...] | None = None
+_local_commands_version = 0
+_local_commands_cache: tuple[int, arc.GatewayClient, list[object]] | None = None
+_remote_commands_cache: dict[int, tuple[float, Sequence[hikari.PartialCommand]]] = {}
+_remote_commands_inflight: dict[
+    int,
+    asyncio.Task[Sequence[hikari.PartialCommand]],
+] = {}
 
 
 def _parse_int(value: str, field: str) -> int:
@@ -31,6 +54,7 @@ def _parse_int(value: str, field: str) -> int:
     return int(stripped)
 
 
+@functools.lru_cache(maxsize=256)
 def _parse_scope(scope: str) -> hikari.Snowflake | hikari.UndefinedType:
     scope_int = _parse_int(scope, "scope")
     if scope_int == 0:
@@ -38,6 +62,7 @@ def _parse_scope(scope: str) -> hikari.Snowflake | hikari.UndefinedType:
     return hikari.Snowflake(scope_int)
 
 
+@functools.lru_cache(maxsize=256)
 def _scope_label(guild_scope: hikari.Snowflake | hikari.UndefinedType) -> str:
     if guild_scope is hikari.UNDEFINED:
         return "global"
@@ -45,11 +70,39 @@ def _scope_label(guild_scope: hikari.Snowflake | hikari.UndefinedType) -> str:
 
 
 def _get_application_id(hikari_client: hikari.GatewayBot) -> hikari.Snowflake:
+    global _application_id
+    if _application_id is not None:
+        return _application_id
     me = hikari_client.get_me()
     if me is None:
         msg = "Bot identity unavailable."
         raise RuntimeError(msg)
-    return me.id
+    _application_id = me.id
+    return _application_id
+
+
+def clear_identity_caches() -> None:
+    global _application_id
+    _application_id = None
+    _embed_templates.clear()
+
+
+async def _app_embed(
+    hikari_client: hikari.GatewayBot,
+    title: str,
+    description: str,
+) -> hikari.Embed:
+    template = _embed_templates.get(title)
+    if template is None:
+        template = await reply_embed(hikari_client, title)
+        if hikari_client.get_me() is None:
+            template.description = description
+            return template
+        _embed_templates[title] = template
+    embed = copy.deepcopy(template)
+    embed.description = description
+    embed.timestamp = datetime.datetime.now(datetime.timezone.utc)
+    return embed
 
 
 def _safe_len(value: object | None) -> int:
@@ -58,43 +111,71 @@ def _safe_len(value: object | None) -> int:
     return 0
 
 
-def _collect_local_command_objects(arc_client: arc.GatewayClient) -> list[object]:
-    commands: list[object] = []
-    seen_ids: set[int] = set()
-
-    for attr_name in (
-        "_slash_commands",
-        "_message_commands",
-        "_user_commands",
-        "_commands",
-    ):
+def invalidate_local_command_cache() -> None:
+    global _local_commands_version
+    _local_commands_version += 1
+
+
+def _resolve_command_attr_spec(
+    arc_client: arc.GatewayClient,
+) -> tuple[tuple[str, bool], ...]:
+    spec: list[tuple[str, bool]] = []
+    for attr_name in _COMMAND_ATTR_NAMES:
         raw = getattr(arc_client, attr_name, None)
         if isinstance(raw, Mapping):
-            values = list(raw.values())
+            spec.append((attr_name, True))
         elif isinstance(raw, Sequence) and not isinstance(raw, (str, bytes, bytearray)):
-            values = list(raw)
-        else:
-            continue
+            spec.append((attr_name, False))
+    return tuple(spec)
 
-        for entry in values:
-            entry_id = id(entry)
-            if entry_id in seen_ids:
-                continue
-            seen_ids.add(entry_id)
-            commands.append(entry)
-    return commands
+
+def _gather_command_entries(
+    arc_client: arc.GatewayClient,
+    spec: tuple[tuple[str, bool], ...],
+) -> list[object]:
+    commands: dict[int, object] = {}
+    for attr_name, is_mapping in spec:
+        raw = getattr(arc_client, attr_name)
+        for entry in raw.values() if is_mapping else raw:
+            commands.setdefault(id(entry), entry)
+    return list(commands.values())
+
+
+def _collect_local_command_objects(arc_client: arc.GatewayClient) -> list[object]:
+    global _command_attr_spec, _local_commands_cache
+    cache = _local_commands_cache
+    if (
+        cache is not None
+        and cache[0] == _local_commands_version
+        and cache[1] is arc_client
+    ):
+        return cache[2]
+
+    if _command_attr_spec is None:
+        _command_attr_spec = _resolve_command_attr_spec(arc_client)
+    try:
+        collected = _gather_command_entries(arc_client, _command_attr_spec)
+    except (AttributeError, TypeError):
+        _command_attr_spec = _resolve_command_attr_spec(arc_client)
+        collected = _gather_command_entries(arc_client, _command_attr_spec)
+
+    _local_commands_cache = (_local_commands_version, arc_client, collected)
+    return collected
 
 
 def _serialize_obj(value: object) -> object:
-    if isinstance(value, (str, int, float, bool, type(None))):
+    if type(value) in _LEAF_TYPES:
+        return value
+    if isinstance(value, (str, int, float)):
         return value
     if isinstance(value, Mapping):
         return {str(k): _serialize_obj(v) for k, v in value.items()}
-    if isinstance(value, Sequence) and not isinstance(value, (str, bytes, bytearray)):
+    if isinstance(value, Sequence) and not isinstance(value, (bytes, bytearray)):
         return [_serialize_obj(v) for v in value]
-    if isinstance(value, _SupportsToDict):
+    to_dict = getattr(value, "to_dict", None)
+    if callable(to_dict):
         try:
-            return _serialize_obj(value.to_dict())
+            return _serialize_obj(to_dict())
         except Exception:
             return repr(value)
     if hasattr(value, "__dict__"):
@@ -112,11 +193,18 @@ def _serialize_obj(value: object) -> object:
     return repr(value)
 
 
+class _FilenameTable(dict[int, str]):
+    def __missing__(self, key: int) -> str:
+        return "_"
+
+
+_FILENAME_TABLE = _FilenameTable(
+    {ord(ch): ch for ch in f"{string.ascii_letters}{string.digits}-_"},
+)
+
+
 def _filename_stem(name: str) -> str:
-    safe = "".join(
-        ch if ch.isalnum() or ch in ("-", "_") else "_" for ch in name.strip()
-    )
-    safe = safe or "command"
+    safe = name.strip().translate(_FILENAME_TABLE) or "command"
     return safe[:64]
 
 
@@ -126,24 +214,71 @@ async def _respond_json_attachment(
     *,
     name: str,
 ) -> None:
-    content = pprint.pformat(payload, indent=2, sort_dicts=True, width=120)
-    attachment = hikari.Bytes(content.encode("utf-8"), f"{_filename_stem(name)}.json")
+    content = orjson.dumps(
+        payload,
+        default=repr,
+        option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS,
+    )
+    attachment = hikari.Bytes(content, f"{_filename_stem(name)}.json")
     await ctx.respond(
         attachments=[attachment],
         flags=hikari.MessageFlag.EPHEMERAL,
     )
 
 
-async def _fetch_remote_commands(
-    *,
+def _scope_key(guild_scope: hikari.Snowflake | hikari.UndefinedType) -> int:
+    if guild_scope is hikari.UNDEFINED:
+        return 0
+    return int(guild_scope)
+
+
+def _invalidate_remote_commands() -> None:
+    _remote_commands_cache.clear()
+
+
+async def _request_remote_commands(
     hikari_client: hikari.GatewayBot,
     guild_scope: hikari.Snowflake | hikari.UndefinedType,
 ) -> Sequence[hikari.PartialCommand]:
     app_id = _get_application_id(hikari_client)
-    return await hikari_client.rest.fetch_application_commands(
+    commands = await hikari_client.rest.fetch_application_commands(
         application=app_id,
         guild=guild_scope,
     )
+    _remote_commands_cache[_scope_key(guild_scope)] = (time.monotonic(), commands)
+    return commands
+
+
+def _finish_remote_request(
+    scope_key: int,
+    task: asyncio.Task[Sequence[hikari.PartialCommand]],
+) -> None:
+    if _remote_commands_inflight.get(scope_key) is task:
+        del _remote_commands_inflight[scope_key]
+    if not task.cancelled():
+        task.exception()
+
+
+async def _fetch_remote_commands(
+    *,
+    hikari_client: hikari.GatewayBot,
+    guild_scope: hikari.Snowflake | hikari.UndefinedType,
+) -> Sequence[hikari.PartialCommand]:
+    scope_key = _scope_key(guild_scope)
+    cached = _remote_commands_cache.get(scope_key)
+    if cached is not None and time.monotonic() - cached[0] < _REMOTE_COMMANDS_TTL:
+        return cached[1]
+
+    task = _remote_commands_inflight.get(scope_key)
+    if task is None:
+        task = asyncio.create_task(
+            _request_remote_commands(hikari_client, guild_scope),
+        )
+        _remote_commands_inflight[scope_key] = task
+        task.add_done_callback(
+            functools.partial(_finish_remote_request, scope_key),
+        )
+    return await asyncio.shield(task)
 
 
 def _scope_from_autocomplete(
@@ -167,15 +302,23 @@ def _rank_choices(query: str, names: list[str]) -> list[str]:
         return names[:_MAX_CHOICES]
 
     if fuzz_process is not None:
-        mapping = {name: name for name in names}
-        ranked = fuzz_process.extract(query, mapping, limit=_MAX_CHOICES)
-        return [match[0] for match in ranked if match[1] >= 80]
-
-    query_cf = query.casefold()
-    prefix = [name for name in names if name.casefold().startswith(query_cf)]
-    contains = [
-        name for name in names if query_cf in name.casefold() and name not in prefix
-    ]
+        ranked = fuzz_process.extract(
+            query,
+            names,
+            scorer=fuzz.WRatio,
+            processor=fuzz_utils.default_process,
+            limit=_MAX_CHOICES,
+            score_cutoff=80,
+        )
+        return [match[0] for match in ranked]
+
+    prefix: list[str] = []
+    contains: list[str] = []
+    for name in names:
+        if name.startswith(query):
+            prefix.append(name)
+        elif query in name:
+            contains.append(name)
     return (prefix + contains)[:_MAX_CHOICES]
 
 
@@ -200,7 +343,7 @@ async def cmd_app_info(ctx: arc.GatewayContext) -> None:
     if tracked_scopes == 0:
         tracked_scopes = _safe_len(getattr(arc_client, "_commands", None))
 
-    embed = await reply_embed(
+    embed = await _app_embed(
         hikari_client,
         "Application-Commands Cache",
         "Internal application command diagnostics.",
@@ -308,7 +451,7 @@ async def cmd_app_scope(
     if len(description) > 3800:
         description = f"{description[:3797]}..."
 
-    embed = await reply_embed(
+    embed = await _app_embed(
         hikari_client,
         "Application Command Information",
         description,
@@ -343,6 +486,7 @@ async def cmd_app_delete(
                 commands=[],
                 guild=guild_scope,
             )
+            _invalidate_remote_commands()
             await ctx.respond(
                 f"Successfully deleted all commands in scope `{scope_label}`.",
                 flags=hikari.MessageFlag.EPHEMERAL,
@@ -355,6 +499,7 @@ async def cmd_app_delete(
             command=target_id,
             guild=guild_scope,
         )
+        _invalidate_remote_commands()
         await ctx.respond(
             f"Successfully deleted command with ID `{target_id}` in scope `{scope_label}`.",
             flags=hikari.MessageFlag.EPHEMERAL,
@@ -1,17 +1,20 @@
 from __future__ import annotations
 
+import hashlib
 import io
+import itertools
+import linecache
 import textwrap
-import traceback
+import types
 import typing
 from collections import OrderedDict
-from collections.abc import Iterable
+from collections.abc import Iterator
 from contextlib import redirect_stdout
 
 import hikari
 import miru
 
-from src.container.app import get_arc, get_hikari, get_miru
+from src.container.app import get_app, get_hikari, get_miru
 from src.shared.constants import TOKEN
 from src.shared.logger import logger
 from src.shared.utils.view import reply_err
@@ -25,7 +28,12 @@ _MAX_MESSAGE_LEN = 2000
 _CODE_BLOCK_OVERHEAD = len("```py\n\n```")
 _MAX_CODE_PAYLOAD = _MAX_MESSAGE_LEN - _CODE_BLOCK_OVERHEAD
 
-_EXEC_CACHE_MAX = 128
+_MAX_RESULT_ITEMS = 1000
+_TRACEBACK_LIMIT = 20
+_LAZY_ITERATORS = (types.GeneratorType, map, filter, zip)
+_ITERABLE_RESULTS = (list, tuple, set, frozenset, *_LAZY_ITERATORS)
+
+_EXEC_CACHE_MAX = 256
 _exec_cache: OrderedDict[int, str] = OrderedDict()
 
 
@@ -36,6 +44,39 @@ def _cache_exec(author_id: int, body: str) -> None:
         _exec_cache.popitem(last=False)
 
 
+_COMPILE_CACHE_MAX = 64
+_compile_cache: OrderedDict[bytes, types.CodeType] = OrderedDict()
+
+
+def _exec_filename(key: bytes) -> str:
+    return f"<debug-exec-{key.hex()}>"
+
+
+def _register_source(filename: str, source: str) -> None:
+    linecache.cache[filename] = (
+        len(source),
+        None,
+        source.splitlines(keepends=True),
+        filename,
+    )
+
+
+def _compile_exec(source: str) -> types.CodeType:
+    key = hashlib.blake2b(source.encode(), digest_size=16).digest()
+    filename = _exec_filename(key)
+    _register_source(filename, source)
+    code = _compile_cache.get(key)
+    if code is not None:
+        _compile_cache.move_to_end(key)
+        return code
+    code = compile(source, filename, "exec")
+    _compile_cache[key] = code
+    if len(_compile_cache) > _COMPILE_CACHE_MAX:
+        evicted, _ = _compile_cache.popitem(last=False)
+        linecache.cache.pop(_exec_filename(evicted), None)
+    return code
+
+
 def _strip_code_block(body: str) -> str:
     cleaned = body.strip()
     if cleaned.startswith("```") and cleaned.endswith("```"):
@@ -45,14 +86,22 @@ def _strip_code_block(body: str) -> str:
     return cleaned.strip("` \n")
 
 
-def _split_chunks(value: str, max_len: int) -> list[str]:
+def _format_syntax_error(exc: SyntaxError) -> str:
+    lineno = max((exc.lineno or 1) - 1, 1)
+    text = (exc.text or "").strip()
+    return f"SyntaxError: {exc.msg} at line {lineno}\n  {text}"
+
+
+def _code_blocks(value: str) -> Iterator[str]:
     if not value:
-        return [""]
-    return [value[i : i + max_len] for i in range(0, len(value), max_len)]
+        yield "```py\n\n```"
+        return
+    for i in range(0, len(value), _MAX_CODE_PAYLOAD):
+        yield f"```py\n{value[i : i + _MAX_CODE_PAYLOAD]}\n```"
 
 
 def _sanitize_output(value: str) -> str:
-    if TOKEN:
+    if TOKEN and TOKEN in value:
         return value.replace(TOKEN, "[REDACTED TOKEN]")
     return value
 
@@ -61,12 +110,8 @@ async def _respond_code_chunks(
     ctx: miru.ModalContext,
     source: str,
 ) -> None:
-    chunks = _split_chunks(_sanitize_output(source), _MAX_CODE_PAYLOAD)
-    for chunk in chunks:
-        await ctx.respond(
-            f"```py\n{chunk}\n```",
-            flags=hikari.MessageFlag.EPHEMERAL,
-        )
+    for block in _code_blocks(_sanitize_output(source)):
+        await ctx.respond(block, flags=hikari.MessageFlag.EPHEMERAL)
 
 
 async def _respond_embed_pages(
@@ -82,6 +127,17 @@ async def _respond_embed_pages(
         )
 
 
+async def _respond_items(ctx: miru.ModalContext, result: object) -> None:
+    if isinstance(result, _LAZY_ITERATORS):
+        items = list(itertools.islice(result, _MAX_RESULT_ITEMS))
+    else:
+        items = list(typing.cast("typing.Iterable[object]", result))
+    if items and all(isinstance(item, hikari.Embed) for item in items):
+        await _respond_embed_pages(ctx, typing.cast("list[hikari.Embed]", items))
+        return
+    await _respond_code_chunks(ctx, repr(items))
+
+
 class _DebugExecModal(miru.Modal):
     def __init__(self, command_ctx: arc.GatewayContext) -> None:
         super().__init__(title="Debug-Exec", custom_id="kernel:debug:exec")
@@ -111,19 +167,20 @@ class _DebugExecModal(miru.Modal):
         _cache_exec(self._author_id, raw_body)
         body = _strip_code_block(raw_body)
 
+        app = get_app()
         env: dict[str, object] = {
-            "hikari_client": get_hikari(),
-            "arc_client": get_arc(),
-            "miru_client": get_miru(),
+            **_BASE_GLOBALS,
+            "hikari_client": app.hikari_client,
+            "arc_client": app.arc_client,
+            "miru_client": app.miru_client,
             "ctx": ctx,
             "command_ctx": self._command_ctx,
             "channel": getattr(ctx, "channel", None),
             "author": ctx.user,
             "guild": getattr(ctx, "guild", None),
-            "bot": get_hikari(),
+            "bot": app.hikari_client,
             "__name__": "__debug_exec__",
         }
-        env.update({k: v for k, v in globals().items() if k != "TOKEN"})
 
         stdout = io.StringIO()
         to_compile = "async def __debug_exec_func__():\n{}".format(
@@ -134,11 +191,13 @@ class _DebugExecModal(miru.Modal):
         )
 
         try:
-            exec(to_compile, env)
-        except SyntaxError:
-            await _respond_code_chunks(ctx, traceback.format_exc())
+            code = _compile_exec(to_compile)
+        except SyntaxError as exc:
+            await _respond_code_chunks(ctx, _format_syntax_error(exc))
             return
 
+        exec(code, env)
+
         func_obj = env.get("__debug_exec_func__")
         if not callable(func_obj):
             await ctx.respond(
@@ -155,11 +214,13 @@ class _DebugExecModal(miru.Modal):
                 )
                 awaitable = func()
                 result = await awaitable
-        except Exception:
-            await _respond_code_chunks(
-                ctx,
-                f"{stdout.getvalue()}{traceback.format_exc()}",
+        except Exception as exc:
+            import traceback
+
+            trace = "".join(
+                traceback.format_exception(exc, limit=-_TRACEBACK_LIMIT, chain=False),
             )
+            await _respond_code_chunks(ctx, f"{stdout.getvalue()}{trace}")
             return
 
         await self._handle_exec_result(
@@ -179,10 +240,22 @@ class _DebugExecModal(miru.Modal):
     ) -> None:
         await _respond_code_chunks(ctx, body)
 
+        if isinstance(result, str):
+            await _respond_code_chunks(ctx, result)
+            return
+
         if result is None:
-            result = stdout_value or "No Output!"
+            await _respond_code_chunks(ctx, stdout_value or "No Output!")
+            return
+
+        if isinstance(result, hikari.Embed):
+            await ctx.respond(
+                embeds=[result],
+                flags=hikari.MessageFlag.EPHEMERAL,
+            )
+            return
 
-        elif isinstance(result, hikari.Message):
+        if isinstance(result, hikari.Message):
             jump_url = getattr(result, "jump_url", None)
             if jump_url:
                 await ctx.respond(
@@ -190,35 +263,21 @@ class _DebugExecModal(miru.Modal):
                     flags=hikari.MessageFlag.EPHEMERAL,
                 )
                 return
-            result = result.content or "No Output!"
-
-        elif isinstance(result, hikari.Embed):
-            await ctx.respond(
-                embeds=[result],
-                flags=hikari.MessageFlag.EPHEMERAL,
-            )
+            await _respond_code_chunks(ctx, result.content or "No Output!")
             return
 
-        elif isinstance(result, (hikari.File, hikari.Bytes)):
+        if isinstance(result, (hikari.File, hikari.Bytes)):
             await ctx.respond(
                 attachments=[result],
                 flags=hikari.MessageFlag.EPHEMERAL,
             )
             return
 
-        elif isinstance(result, Iterable) and not isinstance(result, (str, bytes)):
-            items = list(result)
-            if items and all(isinstance(item, hikari.Embed) for item in items):
-                await _respond_embed_pages(
-                    ctx, typing.cast("list[hikari.Embed]", items)
-                )
-                return
-            result = repr(items)
-
-        if not isinstance(result, str):
-            result = repr(result)
+        if isinstance(result, _ITERABLE_RESULTS):
+            await _respond_items(ctx, result)
+            return
 
-        await _respond_code_chunks(ctx, _sanitize_output(result))
+        await _respond_code_chunks(ctx, repr(result))
 
 
 async def cmd_app_exec(ctx: arc.GatewayContext) -> None:
@@ -231,3 +290,8 @@ async def cmd_app_exec(ctx: arc.GatewayContext) -> None:
     except Exception as exc:
         logger.exception("Failed to open debug exec modal")
         await reply_err(get_hikari(), ctx, f"Failed to open debug exec modal: {exc}")
+
+
+_BASE_GLOBALS: dict[str, object] = {
+    name: value for name, value in globals().items() if name != "TOKEN"
+}
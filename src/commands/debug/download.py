@@ -1,51 +1,71 @@
 from __future__ import annotations
 
 import asyncio
-import contextlib
+import fnmatch
+import io
+import os
 import pathlib
+import re
 import tarfile
-import tempfile
 from typing import TYPE_CHECKING
 
-import compression.zstd
 import hikari
 
 from src.container.app import get_hikari
 from src.shared.constants import BASE_DIR
 from src.shared.logger import logger
+from src.shared.utils.archive import (
+    build_native_archive,
+    has_native_archiver,
+    open_archive_writer,
+)
 from src.shared.utils.view import defer, reply_err
 
 if TYPE_CHECKING:
     import arc
 
 _dl_lock = asyncio.Lock()
-_EXCLUDED_NAMES = frozenset({".git", "venv", "__pycache__", ".env", ".bak", "flag"})
+_EXCLUDED_NAMES = frozenset(
+    {
+        ".git",
+        "venv",
+        "__pycache__",
+        ".env",
+        ".bak",
+        "flag",
+    },
+)
 _EXCLUDED_PATTERNS = frozenset({"*.pyc", "*.log"})
+_EXCLUDED_RE = re.compile(
+    "|".join(fnmatch.translate(pattern) for pattern in sorted(_EXCLUDED_PATTERNS)),
+)
 
 
-def _should_exclude(tar_name: str) -> bool:
-    path = pathlib.PurePosixPath(tar_name)
-    for part in path.parts:
-        if part in _EXCLUDED_NAMES:
-            return True
-        if any(
-            pathlib.PurePosixPath(part).match(pattern) for pattern in _EXCLUDED_PATTERNS
-        ):
-            return True
-    return False
+def _is_excluded(name: str) -> bool:
+    return name in _EXCLUDED_NAMES or _EXCLUDED_RE.fullmatch(name) is not None
 
 
-def _build_archive(destination: pathlib.Path, source_path: pathlib.Path) -> None:
-    def tar_filter(tarinfo: tarfile.TarInfo) -> tarfile.TarInfo | None:
-        if _should_exclude(tarinfo.name):
-            logger.info("Excluding '%s' from archive", tarinfo.name)
-            return None
-        return tarinfo
+def _walk_add(tar: tarfile.TarFile, directory: str, arcname: str) -> None:
+    with os.scandir(directory) as it:
+        entries = sorted(it, key=lambda entry: entry.name)
 
-    with compression.zstd.ZstdFile(destination, mode="wb", level=6) as zstd_out:
-        with tarfile.open(mode="w|", fileobj=zstd_out) as tar:
-            tar.add(source_path, arcname=".", filter=tar_filter)
-    logger.info("Compressed code to '%s'", destination)
+    for entry in entries:
+        member = f"{arcname}/{entry.name}"
+        if _is_excluded(entry.name):
+            logger.info("Excluding '%s' from archive", member)
+            continue
+        tar.add(entry.path, arcname=member, recursive=False)
+        if entry.is_dir(follow_symlinks=False):
+            _walk_add(tar, entry.path, member)
+
+
+def _build_archive(source_path: pathlib.Path) -> bytes:
+    buffer = io.BytesIO()
+    with open_archive_writer(buffer) as tar:
+        tar.add(source_path, arcname=".", recursive=False)
+        _walk_add(tar, os.fspath(source_path), ".")
+    logger.info("Compressed code (%d bytes)", buffer.tell())
+    return buffer.getvalue()
 
 
 async def cmd_debug_download(ctx: arc.GatewayContext) -> None:
@@ -65,32 +85,24 @@ async def cmd_debug_download(ctx: arc.GatewayContext) -> None:
             ctx.user.id,
         )
 
-        temp_file_path: pathlib.Path | None = None
         try:
-            with tempfile.NamedTemporaryFile(
-                suffix=".tar.zst",
-                prefix="Discord-Bot-Framework_",
-                delete=False,
-            ) as tmp:
-                temp_file_path = pathlib.Path(tmp.name)
-
-            await asyncio.to_thread(_build_archive, temp_file_path, BASE_DIR)
-
-            file_size = temp_file_path.stat().st_size
-            if file_size <= 0:
+            if has_native_archiver():
+                data = await build_native_archive(
+                    BASE_DIR,
+                    ".",
+                    excludes=(*_EXCLUDED_NAMES, *_EXCLUDED_PATTERNS),
+                )
+            else:
+                data = await asyncio.to_thread(_build_archive, BASE_DIR)
+
+            if not data:
                 msg = "Archive is empty"
                 raise RuntimeError(msg)
 
-            logger.info(
-                "Sending archive '%s' (%d bytes)",
-                temp_file_path,
-                file_size,
-            )
+            logger.info("Sending archive (%d bytes)", len(data))
             await ctx.respond(
                 "Code archive attached:",
-                attachments=[
-                    hikari.File(str(temp_file_path), filename="client_code.tar.zst"),
-                ],
+                attachments=[hikari.Bytes(data, "client_code.tar.zst")],
             )
 
         except Exception as exc:
@@ -100,8 +112,3 @@ async def cmd_debug_download(ctx: arc.GatewayContext) -> None:
                 ctx,
                 f"Failed to complete download: {exc}.",
             )
-        finally:
-            if temp_file_path is not None:
-                with contextlib.suppress(Exception):
-                    temp_file_path.unlink(missing_ok=True)
-                    logger.info("Cleaned up temporary file: %s", temp_file_path)
@@ -1,19 +1,22 @@
 from __future__ import annotations
 
 import asyncio
+import io
 import os
 import pathlib
-import tarfile
-import tempfile
 from collections.abc import Sequence
 
 import arc
-import compression.zstd
 import hikari
 
 from src.container.app import get_hikari
 from src.shared.constants import BASE_DIR
 from src.shared.logger import logger
+from src.shared.utils.archive import (
+    build_native_archive,
+    has_native_archiver,
+    open_archive_writer,
+)
 from src.shared.utils.view import defer, reply_err
 
 
@@ -30,10 +33,11 @@ def _resolve_export_target(user_path: str) -> tuple[pathlib.Path | None, str | N
     return candidate, None
 
 
-def _build_archive(source: pathlib.Path, archive_path: pathlib.Path) -> None:
-    with compression.zstd.ZstdFile(archive_path, mode="wb", level=6) as zstd_out:
-        with tarfile.open(mode="w|", fileobj=zstd_out) as tar_file:
-            tar_file.add(source, arcname=source.name)
+def _build_archive(source: pathlib.Path) -> bytes:
+    buffer = io.BytesIO()
+    with open_archive_writer(buffer) as tar_file:
+        tar_file.add(source, arcname=source.name)
+    return buffer.getvalue()
 
 
 async def autocomplete_debug_export(
@@ -81,23 +85,24 @@ async def cmd_debug_export(
         return
 
     try:
-        with tempfile.TemporaryDirectory(prefix="export_") as temp_dir:
-            archive_name = f"{target_path.name}.tar.zst"
-            archive_path = pathlib.Path(temp_dir) / archive_name
-            await asyncio.to_thread(_build_archive, target_path, archive_path)
-
-            if not archive_path.is_file() or archive_path.stat().st_size == 0:
-                await reply_err(
-                    hikari_client,
-                    ctx,
-                    "Failed to create archive: output file missing.",
-                )
-                return
-
-            await ctx.respond(
-                f"Exported `{path}`:",
-                attachments=[hikari.File(str(archive_path), filename=archive_name)],
+        archive_name = f"{target_path.name}.tar.zst"
+        if has_native_archiver():
+            data = await build_native_archive(target_path.parent, target_path.name)
+        else:
+            data = await asyncio.to_thread(_build_archive, target_path)
+
+        if not data:
+            await reply_err(
+                hikari_client,
+                ctx,
+                "Failed to create archive: output is empty.",
             )
+            return
+
+        await ctx.respond(
+            f"Exported `{path}`:",
+            attachments=[hikari.Bytes(data, archive_name)],
+        )
     except Exception:
         logger.exception("Failed to create export archive for '%s'", path)
         await reply_err(hikari_client, ctx, "Failed to create archive.")
@@ -2,14 +2,14 @@ from __future__ import annotations
 
 import asyncio
 import contextlib
-import datetime
 import os
 import sys
 from typing import TYPE_CHECKING
 
 from src.container.app import get_hikari
-from src.shared.constants import FLAG_DIR, SHUTDOWN_EVENT, Color
+from src.shared.constants import SHUTDOWN_EVENT, Color
 from src.shared.logger import logger
+from src.shared.utils.flag import write_restart_flag
 from src.shared.utils.member import dm_role_members
 from src.shared.utils.view import defer, reply_embed, reply_err, reply_ok
 
@@ -18,20 +18,10 @@ if TYPE_CHECKING:
     import hikari
 
 
-def _write_restart_flag(executor_id: hikari.Snowflake) -> None:
-    FLAG_DIR.mkdir(exist_ok=True)
-    restart_flag = FLAG_DIR / "restart"
-    restart_flag.write_text(
-        "Restart triggered by debug command at "
-        f"{datetime.datetime.now(datetime.timezone.utc).isoformat()} by {executor_id}",
-    )
-    logger.info("Wrote restart flag to %s", restart_flag)
-
-
 async def _announce_restart(
+    hikari_client: hikari.GatewayBot,
     ctx: arc.GatewayContext,
 ) -> None:
-    hikari_client = get_hikari()
     embed = await reply_embed(
         hikari_client,
         "Initiating Restart",
@@ -51,9 +41,9 @@ async def cmd_debug_restart(ctx: arc.GatewayContext) -> None:
     hikari_client = get_hikari()
 
     try:
-        await _announce_restart(ctx)
+        await _announce_restart(hikari_client, ctx)
         await reply_ok(hikari_client, ctx, "Initiated bot restart sequence.")
-        _write_restart_flag(ctx.user.id)
+        write_restart_flag("debug-restart", ctx.user.id)
         logger.info("Attempting graceful restart")
         shutdown_func = None
         main_mod = sys.modules.get("__main__") or sys.modules.get("main")
@@ -2,7 +2,6 @@ from __future__ import annotations
 
 import asyncio
 import contextlib
-import datetime
 import os
 from typing import TYPE_CHECKING
 
@@ -10,8 +9,9 @@ from src.container.app import get_hikari
 from src.git.utils import get_kernel_info
 from src.modules.python.pip import run_pip
 from src.modules.utils import pull_kernel
-from src.shared.constants import BASE_DIR, FLAG_DIR, Color
+from src.shared.constants import BASE_DIR, Color
 from src.shared.logger import logger
+from src.shared.utils.flag import write_restart_flag
 from src.shared.utils.member import dm_role_members
 from src.shared.utils.view import defer, reply_embed, reply_err, reply_ok, response
 
@@ -51,7 +51,7 @@ async def _announce_update_start(
     repo_url: str,
     current_commit_id: str,
     target_commit_id: str,
-    uncommitted_changes: int,
+    divergent_commits: int,
 ) -> None:
     embed = await reply_embed(
         hikari_client,
@@ -62,10 +62,13 @@ async def _announce_update_start(
     embed.url = repo_url
     embed.add_field(name="Current Commit", value=f"`{current_commit_id}`", inline=True)
     embed.add_field(name="Target Commit", value=f"`{target_commit_id}`", inline=True)
-    if uncommitted_changes > 0:
+    if divergent_commits > 0:
         embed.add_field(
             name="Warning",
-            value="Local modifications detected and will be overwritten.",
+            value=(
+                f"Local branch is {divergent_commits} commit(s) ahead/behind "
+                "remote; local commits will be overwritten."
+            ),
         )
     if ctx.member:
         embed.set_author(
@@ -78,16 +81,6 @@ async def _announce_update_start(
         logger.exception("Failed to send kernel update start notification")
 
 
-def _write_restart_flag(executor_id: hikari.Snowflake) -> None:
-    FLAG_DIR.mkdir(exist_ok=True)
-    reboot_flag = FLAG_DIR / "restart"
-    reboot_flag.write_text(
-        "Restart triggered post-kernel-update at "
-        f"{datetime.datetime.now(datetime.timezone.utc).isoformat()} by {executor_id}",
-    )
-    logger.info("Set restart flag at %s", reboot_flag)
-
-
 async def cmd_kernel_update(ctx: arc.GatewayContext) -> None:
     await defer(ctx)
     executor = ctx.user
@@ -99,7 +92,7 @@ async def cmd_kernel_update(ctx: arc.GatewayContext) -> None:
         executor.id,
     )
 
-    info = get_kernel_info()
+    info = await asyncio.to_thread(get_kernel_info, force=True)
     if not info:
         await reply_err(
             hikari_client,
@@ -112,12 +105,12 @@ async def cmd_kernel_update(ctx: arc.GatewayContext) -> None:
         info.local_commit
         and info.remote_commit
         and info.local_commit.id == info.remote_commit.id
-        and info.uncommitted_changes == 0
+        and info.divergent_commits == 0
     ):
         await reply_ok(
             hikari_client,
             ctx,
-            "Kernel already up-to-date (no local modifications).",
+            "Kernel already up-to-date (in sync with remote).",
         )
         return
 
@@ -125,10 +118,10 @@ async def cmd_kernel_update(ctx: arc.GatewayContext) -> None:
     target_commit_id = _commit_id(info.remote_commit)
 
     logger.info(
-        "Initiated kernel update: cur=%s target=%s uncommitted_changes=%d",
+        "Initiated kernel update: cur=%s target=%s divergent_commits=%d",
         current_commit_id,
         target_commit_id,
-        info.uncommitted_changes,
+        info.divergent_commits,
     )
 
     await _announce_update_start(
@@ -137,7 +130,7 @@ async def cmd_kernel_update(ctx: arc.GatewayContext) -> None:
         info.url,
         current_commit_id,
         target_commit_id,
-        info.uncommitted_changes,
+        info.divergent_commits,
     )
 
     await _progress(hikari_client, ctx, "Pulling kernel updates.")
@@ -158,8 +151,7 @@ async def cmd_kernel_update(ctx: arc.GatewayContext) -> None:
         return
 
     await _progress(hikari_client, ctx, "Updating kernel dependencies.")
-    pip_success = await asyncio.to_thread(
-        run_pip,
+    pip_success = await run_pip(
         str(BASE_DIR / "requirements.txt"),
         install=True,
     )
@@ -191,7 +183,7 @@ async def cmd_kernel_update(ctx: arc.GatewayContext) -> None:
         logger.exception("Failed to send kernel update completion response")
 
     try:
-        _write_restart_flag(executor.id)
+        write_restart_flag("kernel-update", executor.id)
         reboot_notice_embed = await reply_embed(
             hikari_client,
             "Restarting",
@@ -1,39 +1,62 @@
 from __future__ import annotations
 
-import os
-from collections.abc import Sequence
+import bisect
+from collections.abc import Iterable, Sequence
 
 import arc
-from src.git.utils import is_valid_repo
-from src.shared.constants import EXTENSIONS_DIR
+from src.commands.module.cache import load_module_index
 from src.shared.logger import logger
 
 _MAX_CHOICES = 25
+_GRAM = 2
 
+_gram_index: tuple[tuple[str, ...], dict[str, frozenset[int]]] | None = None
 
-def _discover_valid_modules() -> list[str]:
-    with os.scandir(EXTENSIONS_DIR) as entries:
-        modules = [
-            entry.name
-            for entry in entries
-            if entry.is_dir()
-            and entry.name != "__pycache__"
-            and is_valid_repo(entry.name)
-        ]
-    return sorted(modules, key=str.casefold)
 
+def _build_gram_index(folded: tuple[str, ...]) -> dict[str, frozenset[int]]:
+    postings: dict[str, set[int]] = {}
+    for index, name_cf in enumerate(folded):
+        for start in range(len(name_cf) - _GRAM + 1):
+            postings.setdefault(name_cf[start : start + _GRAM], set()).add(index)
+    return {gram: frozenset(indices) for gram, indices in postings.items()}
 
-def _rank_matches(modules: list[str], query: str) -> list[str]:
+
+def _contains_candidates(folded: tuple[str, ...], query_cf: str) -> Iterable[int]:
+    global _gram_index
+    if len(query_cf) < _GRAM:
+        return range(len(folded))
+
+    if _gram_index is None or _gram_index[0] is not folded:
+        _gram_index = (folded, _build_gram_index(folded))
+    postings = _gram_index[1]
+
+    grams = {query_cf[start : start + _GRAM] for start in range(len(query_cf) - _GRAM + 1)}
+    lists = sorted((postings.get(gram, frozenset()) for gram in grams), key=len)
+    return sorted(lists[0].intersection(*lists[1:]))
+
+
+def _rank_matches(
+    modules: tuple[str, ...],
+    folded: tuple[str, ...],
+    query: str,
+) -> list[str]:
     if not query:
-        return modules[:_MAX_CHOICES]
+        return list(modules[:_MAX_CHOICES])
+
     query_cf = query.casefold()
-    prefix_matches = [name for name in modules if name.casefold().startswith(query_cf)]
-    contains_matches = [
-        name
-        for name in modules
-        if query_cf in name.casefold() and name not in prefix_matches
-    ]
-    return (prefix_matches + contains_matches)[:_MAX_CHOICES]
+    matches: list[str] = []
+    for index in range(bisect.bisect_left(folded, query_cf), len(folded)):
+        if len(matches) >= _MAX_CHOICES or not folded[index].startswith(query_cf):
+            break
+        matches.append(modules[index])
+
+    if len(matches) < _MAX_CHOICES:
+        for index in _contains_candidates(folded, query_cf):
+            if folded[index].find(query_cf) > 0:
+                matches.append(modules[index])
+                if len(matches) >= _MAX_CHOICES:
+                    break
+    return matches
 
 
 async def autocomplete_module(
@@ -42,10 +65,10 @@ async def autocomplete_module(
     query = (ctx.focused_value or "").strip()
 
     try:
-        valid_modules = _discover_valid_modules()
+        valid_modules, folded = await load_module_index()
         if not valid_modules:
             return ["none"]
-        choices = _rank_matches(valid_modules, query)
+        choices = _rank_matches(valid_modules, folded, query)
         if query and not choices:
             return ["no_match"]
         return choices
@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+import asyncio
+import os
+
+from src.git.utils import is_valid_repo_entry
+from src.shared.constants import EXTENSIONS_DIR
+
+_ModuleIndex = tuple[tuple[str, ...], tuple[str, ...]]
+
+_DirStamp = tuple[int, int]
+
+_Validity = dict[str, tuple[_DirStamp, bool]]
+
+_CacheEntry = tuple[int, _ModuleIndex, frozenset[str], frozenset[str]]
+
+_module_cache: _CacheEntry | None = None
+_validity: _Validity = {}
+_generation = 0
+_scan_task: asyncio.Task[_CacheEntry] | None = None
+_scan_generation = -1
+
+
+def invalidate_module_cache() -> None:
+    global _generation, _module_cache, _validity
+    _generation += 1
+    _module_cache = None
+    _validity = {}
+
+
+def _dir_stamp(entry: os.DirEntry[str]) -> _DirStamp | None:
+    try:
+        stat = entry.stat()
+    except OSError:
+        return None
+    return stat.st_ino, stat.st_mtime_ns
+
+
+def _scan_extensions_dir(
+    previous: _CacheEntry | None,
+    validity: _Validity,
+) -> tuple[_CacheEntry, _Validity]:
+    mtime_ns = os.stat(EXTENSIONS_DIR).st_mtime_ns
+    with os.scandir(EXTENSIONS_DIR) as entries:
+        candidates = {
+            entry.name: entry
+            for entry in entries
+            if entry.is_dir() and entry.name != "__pycache__"
+        }
+
+    scanned: _Validity = {}
+    for name, entry in candidates.items():
+        stamp = _dir_stamp(entry)
+        if stamp is None:
+            continue
+        cached = validity.get(name)
+        valid = (
+            cached[1]
+            if cached is not None and cached[0] == stamp
+            else is_valid_repo_entry(entry)
+        )
+        scanned[name] = (stamp, valid)
+
+    directories = frozenset(candidates)
+    valid_names = frozenset(name for name, (_, valid) in scanned.items() if valid)
+    if (
+        previous is not None
+        and previous[2] == directories
+        and previous[3] == valid_names
+    ):
+        return (mtime_ns, previous[1], directories, valid_names), scanned
+
+    decorated = sorted((name.casefold(), name) for name in valid_names)
+    index = (
+        tuple(name for _, name in decorated),
+        tuple(folded for folded, _ in decorated),
+    )
+    return (mtime_ns, index, directories, valid_names), scanned
+
+
+async def _scan_in_background(generation: int) -> _CacheEntry:
+    global _module_cache, _validity
+    entry, validity = await asyncio.to_thread(
+        _scan_extensions_dir,
+        _module_cache,
+        _validity,
+    )
+    if generation == _generation:
+        _module_cache = entry
+        _validity = validity
+    return entry
+
+
+def _finish_scan(task: asyncio.Task[_CacheEntry]) -> None:
+    global _scan_task
+    if _scan_task is task:
+        _scan_task = None
+    if not task.cancelled():
+        task.exception()
+
+
+async def _load_module_cache() -> _CacheEntry:
+    global _scan_task, _scan_generation
+    mtime_ns = os.stat(EXTENSIONS_DIR).st_mtime_ns
+    cached = _module_cache
+    if cached is not None and cached[0] == mtime_ns:
+        return cached
+
+    task = _scan_task
+    if task is None or _scan_generation != _generation:
+        task = asyncio.create_task(_scan_in_background(_generation))
+        _scan_task = task
+        _scan_generation = _generation
+        task.add_done_callback(_finish_scan)
+    return await asyncio.shield(task)
+
+
+async def load_module_index() -> _ModuleIndex:
+    _, index, _, _ = await _load_module_cache()
+    return index
+
+
+async def module_exists(name: str) -> bool:
+    try:
+        _, _, directories, _ = await _load_module_cache()
+    except FileNotFoundError:
+        return False
+    return name in directories
+
+
+async def module_status(name: str) -> tuple[bool, bool]:
+    try:
+        _, _, directories, valid = await _load_module_cache()
+    except FileNotFoundError:
+        return False, False
+    return name in directories, name in valid
@@ -5,7 +5,7 @@ from typing import TYPE_CHECKING
 from miru.ext import nav
 
 from src.container.app import get_hikari, get_miru
-from src.git.utils import RepoInfo, get_module_info
+from src.git.utils import RepoInfo, get_module_info_async
 from src.shared.constants import Color
 from src.shared.logger import logger
 from src.shared.utils.view import (
@@ -16,39 +16,35 @@ from src.shared.utils.view import (
 )
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
+
     import arc
     import hikari
 
 _MAX_CHANGELOG_FIELD_LEN = 1000
-
-
-def _commit_id(commit: object | None) -> str:
-    commit_id = getattr(commit, "id", None)
-    if commit_id is None:
-        return "N/A"
-    return str(commit_id)[:10]
+_MAX_CHANGELOG_TOTAL_LEN = 5000
 
 
 def _status_text(info: RepoInfo) -> str:
-    if info.uncommitted_changes > 0:
-        return f"{info.uncommitted_changes} local modification(s) detected"
-    return "No local modifications"
+    if info.divergent_commits > 0:
+        return f"{info.divergent_commits} commit(s) ahead/behind remote"
+    return "In sync with remote"
 
 
 def _status_color(info: RepoInfo) -> Color:
-    return Color.WARNING if info.uncommitted_changes > 0 else Color.INFO
+    return Color.WARNING if info.divergent_commits > 0 else Color.INFO
 
 
-def _changelog_chunks(changelog: str) -> list[str]:
-    text = changelog.strip() or "No changelog information available."
-    return [
-        text[index : index + _MAX_CHANGELOG_FIELD_LEN]
-        for index in range(0, len(text), _MAX_CHANGELOG_FIELD_LEN)
-    ]
+def _changelog_chunks(text: str) -> Iterator[str]:
+    for index in range(0, len(text), _MAX_CHANGELOG_FIELD_LEN):
+        yield text[index : index + _MAX_CHANGELOG_FIELD_LEN]
 
 
-async def _build_module_info_embed(module: str, info: RepoInfo) -> hikari.Embed:
-    hikari_client = get_hikari()
+async def _build_module_info_embed(
+    hikari_client: hikari.GatewayBot,
+    module: str,
+    info: RepoInfo,
+) -> hikari.Embed:
     result_embed = await reply_embed(
         hikari_client,
         f"Module: `{module}`",
@@ -61,23 +57,25 @@ async def _build_module_info_embed(module: str, info: RepoInfo) -> hikari.Embed:
     result_embed.add_field(
         name="Local Commit",
         value=(
-            f"ID: `{_commit_id(info.local_commit)}`\nTime: `{info.local_commit_time_utc or 'N/A'}`"
+            f"ID: `{info.short_id}`\nTime: `{info.local_commit_time_utc or 'N/A'}`"
         ),
         inline=True,
     )
     result_embed.add_field(
         name="Remote Commit",
         value=(
-            f"ID: `{_commit_id(info.remote_commit)}`\nTime: `{info.remote_commit_time_utc or 'N/A'}`"
+            f"ID: `{info.remote_short_id}`\nTime: `{info.remote_commit_time_utc or 'N/A'}`"
         ),
         inline=True,
     )
 
-    chunks = _changelog_chunks(info.changelog)
-    for index, chunk in enumerate(chunks):
+    changelog = info.changelog.strip() or "No changelog information available."
+    changelog = changelog[:_MAX_CHANGELOG_TOTAL_LEN]
+    total = -(-len(changelog) // _MAX_CHANGELOG_FIELD_LEN)
+    for index, chunk in enumerate(_changelog_chunks(changelog)):
         field_name = "Recent Changes"
-        if len(chunks) > 1:
-            field_name = f"Recent Changes (Part {index + 1}/{len(chunks)})"
+        if total > 1:
+            field_name = f"Recent Changes (Part {index + 1}/{total})"
         result_embed.add_field(
             name=field_name,
             value=f"```md\n{chunk}\n```",
@@ -95,7 +93,7 @@ async def cmd_module_info(
     hikari_client = get_hikari()
     miru_client = get_miru()
 
-    info, valid = get_module_info(module)
+    info, valid = await get_module_info_async(module)
     if not valid or info is None:
         await reply_err(
             hikari_client,
@@ -110,7 +108,7 @@ async def cmd_module_info(
         nav.NextButton(),
     ]
     try:
-        result_embed = await _build_module_info_embed(module, info)
+        result_embed = await _build_module_info_embed(hikari_client, module, info)
         navigator = nav.navigator.NavigatorView(
             pages=[result_embed],
             items=buttons,
@@ -1,13 +1,14 @@
 from __future__ import annotations
 
-import os
+import functools
+import re
 from typing import TYPE_CHECKING
 
 from miru.ext import nav
 
+from src.commands.module.cache import load_module_index
 from src.container.app import get_hikari, get_miru
-from src.git.utils import get_module_info, is_valid_repo
-from src.shared.constants import EXTENSIONS_DIR
+from src.git.utils import RepoInfo, get_all_modules_info
 from src.shared.logger import logger
 from src.shared.utils.view import (
     defer,
@@ -22,68 +23,70 @@ if TYPE_CHECKING:
 
 
 _MAX_FIELDS = 25
+_DISPLAY_RE = re.compile(r"_([sudh])_")
+_DISPLAY_MAP = {"s": "/", "u": "_", "d": ".", "h": "-"}
 
 
+@functools.lru_cache(maxsize=256)
 def _display_name(module_name: str) -> str:
-    return (
-        module_name.rsplit("__", maxsplit=1)[-1]
-        .replace("_s_", "/")
-        .replace("_u_", "_")
-        .replace("_d_", ".")
-        .replace("_h_", "-")
+    return _DISPLAY_RE.sub(
+        lambda match: _DISPLAY_MAP[match.group(1)],
+        module_name.rsplit("__", maxsplit=1)[-1],
     )
 
 
-def get_loadable_modules() -> list[str]:
+async def get_loadable_modules() -> list[str]:
     try:
-        with os.scandir(EXTENSIONS_DIR) as entries:
-            modules = [
-                entry.name
-                for entry in entries
-                if entry.is_dir()
-                and entry.name != "__pycache__"
-                and is_valid_repo(entry.name)
-            ]
+        modules, _ = await load_module_index()
+        return list(modules)
     except Exception:
         logger.exception("Failed to enumerate loadable modules")
         return []
-    return sorted(modules, key=str.casefold)
 
 
-async def _build_module_list_embed(modules_list: list[str]) -> hikari.Embed:
-    hikari_client = get_hikari()
+def _module_field(
+    module_name: str,
+    result: tuple[RepoInfo | None, bool] | BaseException,
+) -> tuple[str, str]:
+    if isinstance(result, BaseException):
+        logger.error(
+            "Failed to process module '%s' for list",
+            module_name,
+            exc_info=result,
+        )
+        return module_name, "*Error*"
+
+    info, valid = result
+    if not valid or info is None:
+        return module_name, "*Error fetching info*"
+    status = "WARNING " if info.divergent_commits > 0 else ""
+    return (
+        f"{status}{_display_name(module_name)}",
+        f"`{module_name}`\nCommit: `{info.short_id[:7]}`",
+    )
+
+
+async def _build_module_list_embed(
+    hikari_client: hikari.GatewayBot,
+    modules_list: list[str],
+) -> hikari.Embed:
     embed = await reply_embed(
         hikari_client,
         "Module List",
         f"Discovered {len(modules_list)} loadable modules:",
     )
 
-    for index, module_name in enumerate(modules_list):
-        if index >= _MAX_FIELDS:
-            embed.set_footer(text=f"Displaying first {_MAX_FIELDS} modules.")
-            break
-
-        try:
-            info, valid = get_module_info(module_name)
-            if valid and info is not None:
-                commit_id = (
-                    str(info.local_commit.id)[:7] if info.local_commit else "N/A"
-                )
-                status = "WARNING " if info.uncommitted_changes > 0 else ""
-                embed.add_field(
-                    name=f"{status}{_display_name(module_name)}",
-                    value=f"`{module_name}`\nCommit: `{commit_id}`",
-                    inline=True,
-                )
-            else:
-                embed.add_field(
-                    name=module_name,
-                    value="*Error fetching info*",
-                    inline=True,
-                )
-        except Exception:
-            logger.exception("Failed to process module '%s' for list", module_name)
-            embed.add_field(name=module_name, value="*Error*", inline=True)
+    shown = modules_list[:_MAX_FIELDS]
+    results = await get_all_modules_info(shown)
+    fields = [
+        _module_field(module_name, result)
+        for module_name, result in zip(shown, results, strict=True)
+    ]
+    for name, value in fields:
+        embed.add_field(name=name, value=value, inline=True)
+
+    if len(modules_list) > _MAX_FIELDS:
+        embed.set_footer(text=f"Displaying first {_MAX_FIELDS} modules.")
 
     return embed
 
@@ -93,7 +96,7 @@ async def cmd_module_list(ctx: arc.GatewayContext) -> None:
     hikari_client = get_hikari()
     miru_client = get_miru()
 
-    modules_list = get_loadable_modules()
+    modules_list = await get_loadable_modules()
     if not modules_list:
         await reply_err(
             hikari_client,
@@ -102,7 +105,7 @@ async def cmd_module_list(ctx: arc.GatewayContext) -> None:
         )
         return
 
-    embed = await _build_module_list_embed(modules_list)
+    embed = await _build_module_list_embed(hikari_client, modules_list)
     buttons: list[nav.NavItem] = [
         nav.PrevButton(),
         nav.StopButton(),
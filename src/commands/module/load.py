@@ -4,6 +4,7 @@ import asyncio
 import contextlib
 from typing import TYPE_CHECKING
 
+from src.commands.module.cache import invalidate_module_cache, module_exists
 from src.container.app import get_hikari
 from src.git.utils import clone_repo, parse_repo_url
 from src.modules.python.pip import run_pip
@@ -45,6 +46,13 @@ async def _announce_load_start(
     )
 
 
+async def _finish_announcement(task: asyncio.Task[None]) -> None:
+    try:
+        await task
+    except Exception:
+        logger.exception("Failed to send module load start notification")
+
+
 async def _install_requirements_if_present(
     module_name: str,
     hikari_client: hikari.GatewayBot,
@@ -55,7 +63,11 @@ async def _install_requirements_if_present(
         return True
 
     await _progress(hikari_client, ctx, "Installing dependencies.")
-    pip_success = await asyncio.to_thread(run_pip, str(requirements_path), install=True)
+    pip_success = await run_pip(
+        str(requirements_path),
+        install=True,
+        skip_if_satisfied=True,
+    )
     if pip_success:
         return True
 
@@ -87,7 +99,7 @@ async def cmd_module_load(
         await reply_err(hikari_client, ctx, "Failed to parse Git URL: invalid format.")
         return
 
-    if (EXTENSIONS_DIR / parsed_name).is_dir():
+    if await module_exists(parsed_name):
         await reply_err(
             hikari_client,
             ctx,
@@ -105,41 +117,47 @@ async def cmd_module_load(
         )
         return
 
-    await _announce_load_start(hikari_client, ctx, parsed_name)
-
-    await _progress(hikari_client, ctx, f"Cloning `{parsed_name}`.")
-    cloned_name, clone_success = await asyncio.to_thread(clone_repo, git_url)
-    if not clone_success or not cloned_name:
-        await reply_err(
-            hikari_client,
-            ctx,
-            f"Failed to clone repository `{parsed_name}`.",
-        )
-        return
-
-    logger.info("Cloned module '%s' from '%s'", cloned_name, git_url)
-
-    deps_ok = await _install_requirements_if_present(cloned_name, hikari_client, ctx)
-    if not deps_ok:
-        return
-
-    await _progress(hikari_client, ctx, f"Loading `{cloned_name}`")
-    loaded = await registry.load_module(hikari_client, cloned_name)
-    if not loaded:
-        await reply_err(
-            hikari_client,
-            ctx,
-            f"Failed to load module `{cloned_name}` after cloning.",
-        )
-        return
-
-    await reply_ok(hikari_client, ctx, f"Loaded module `{cloned_name}`.")
-    await dm_role_members(
-        embeds=[
-            await reply_embed(
-                hikari_client,
-                "Module Loaded",
-                f"`{cloned_name}` loaded by {ctx.user.mention}.",
-            ),
-        ],
+    announce_task = asyncio.create_task(
+        _announce_load_start(hikari_client, ctx, parsed_name),
     )
+    try:
+        await _progress(hikari_client, ctx, f"Cloning `{parsed_name}`.")
+        cloned_name, clone_success = await asyncio.to_thread(clone_repo, git_url)
+        if not clone_success or not cloned_name:
+            await reply_err(
+                hikari_client,
+                ctx,
+                f"Failed to clone repository `{parsed_name}`.",
+            )
+            return
+
+        logger.info("Cloned module '%s' from '%s'", cloned_name, git_url)
+        invalidate_module_cache()
+
+        deps_ok = await _install_requirements_if_present(cloned_name, hikari_client, ctx)
+        if not deps_ok:
+            return
+
+        await _progress(hikari_client, ctx, f"Loading `{cloned_name}`")
+        loaded = await registry.load_module(hikari_client, cloned_name)
+        if not loaded:
+            await reply_err(
+                hikari_client,
+                ctx,
+                f"Failed to load module `{cloned_name}` after cloning.",
+            )
+            return
+
+        await asyncio.wait([announce_task])
+        await reply_ok(hikari_client, ctx, f"Loaded module `{cloned_name}`.")
+        await dm_role_members(
+            embeds=[
+                await reply_embed(
+                    hikari_client,
+                    "Module Loaded",
+                    f"`{cloned_name}` loaded by {ctx.user.mention}.",
+                ),
+            ],
+        )
+    finally:
+        await _finish_announcement(announce_task)
@@ -3,35 +3,37 @@ from __future__ import annotations
 import asyncio
 from typing import TYPE_CHECKING
 
+from src.commands.module.cache import invalidate_module_cache, module_status
 from src.container.app import get_hikari
-from src.git.utils import get_module_info, is_valid_repo
+from src.git.utils import get_module_info_async
 from src.modules.registry import registry
 from src.modules.utils import delete_module
-from src.shared.constants import EXTENSIONS_DIR, Color
+from src.shared.constants import Color
 from src.shared.logger import logger
 from src.shared.utils.member import dm_role_members
 from src.shared.utils.view import defer, reply_embed, reply_err, reply_ok
 
 if TYPE_CHECKING:
     import arc
+    import hikari
 
 
-def _module_metadata(module: str) -> tuple[str, str]:
-    info, valid_info = get_module_info(module)
+async def _module_metadata(module: str) -> tuple[str, str]:
+    info, valid_info = await get_module_info_async(module)
     if not valid_info or info is None:
         return "Unknown", "Unknown"
-    commit_id = str(info.local_commit.id)[:7] if info.local_commit else "Unknown"
+    commit_id = info.short_id[:7] if info.local_commit else "Unknown"
     remote_url = info.url or "Unknown"
     return commit_id, remote_url
 
 
 async def _announce_unload_start(
+    hikari_client: hikari.GatewayBot,
     ctx: arc.GatewayContext,
     module: str,
     commit_id: str,
     remote_url: str,
 ) -> None:
-    hikari_client = get_hikari()
     embed = await reply_embed(
         hikari_client,
         "Unloading Module",
@@ -63,12 +65,12 @@ async def cmd_module_unload(
         module,
     )
 
-    module_path = EXTENSIONS_DIR / module
-    if not module_path.is_dir():
+    exists, valid = await module_status(module)
+    if not exists:
         await reply_err(hikari_client, ctx, f"Directory `{module}` not found.")
         return
 
-    if not is_valid_repo(module):
+    if not valid:
         await reply_err(
             hikari_client,
             ctx,
@@ -76,8 +78,8 @@ async def cmd_module_unload(
         )
         return
 
-    commit_id, remote_url = _module_metadata(module)
-    await _announce_unload_start(ctx, module, commit_id, remote_url)
+    commit_id, remote_url = await _module_metadata(module)
+    await _announce_unload_start(hikari_client, ctx, module, commit_id, remote_url)
 
     unload_success = True
     if registry.is_module_loaded(module):
@@ -90,6 +92,7 @@ async def cmd_module_unload(
             )
 
     delete_success = await asyncio.to_thread(delete_module, module)
+    invalidate_module_cache()
     if not delete_success:
         logger.exception("Failed to delete module directory for '%s'", module)
         await reply_err(
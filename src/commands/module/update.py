@@ -2,16 +2,20 @@ from __future__ import annotations
 
 import asyncio
 import contextlib
+import functools
+import pathlib
 import shutil
+import sys
 from typing import TYPE_CHECKING
 
 import aioshutil
 import anyio
 import pygit2
 from miru.ext import nav
+from pygit2.enums import ApplyLocation, ResetMode
 
 from src.container.app import get_hikari, get_miru
-from src.git.utils import get_module_info
+from src.git.utils import get_module_info_async
 from src.modules.python.pip import run_pip
 from src.modules.registry import registry
 from src.modules.utils import pull_module
@@ -27,11 +31,20 @@ from src.shared.utils.view import (
 )
 
 if TYPE_CHECKING:
-    import pathlib
+    from collections.abc import AsyncIterator, Iterator
 
     import arc
     import hikari
 
+_FETCH_MAX_AGE = 30.0
+_PULL_ERRORS = {
+    1: "Cannot update the main repo using this command.",
+    2: "Failed to fetch or apply remote changes.",
+    3: "Master branch not found or checkout failed.",
+}
+_MAX_CHANGELOG_FIELD_LEN = 1000
+_MAX_CHANGELOG_TOTAL_LEN = 5000
+
 
 def _commit_id(commit: pygit2.Commit | None) -> str:
     if commit is None:
@@ -39,41 +52,160 @@ def _commit_id(commit: pygit2.Commit | None) -> str:
     return str(commit.id)
 
 
-async def _progress(
+@functools.cache
+def _rm_executable() -> str | None:
+    if sys.platform == "win32":
+        return None
+    return shutil.which("rm")
+
+
+@functools.cache
+def _cp_executable() -> str | None:
+    if not sys.platform.startswith("linux"):
+        return None
+    return shutil.which("cp")
+
+
+async def _fast_rmtree(path: pathlib.Path) -> None:
+    rm = _rm_executable()
+    if rm is None:
+        await aioshutil.rmtree(path)
+        return
+
+    process = await asyncio.create_subprocess_exec(
+        rm,
+        "-rf",
+        "--",
+        str(path),
+        stderr=asyncio.subprocess.PIPE,
+    )
+    _, stderr = await process.communicate()
+    if process.returncode != 0:
+        detail = stderr.decode(errors="replace").strip()
+        msg = f"rm exited with status {process.returncode} for '{path}': {detail}"
+        raise OSError(msg)
+
+
+async def _snapshot_or_copy(src: pathlib.Path, dst: pathlib.Path) -> None:
+    cp = _cp_executable()
+    if cp is not None:
+        process = await asyncio.create_subprocess_exec(
+            cp,
+            "-a",
+            "--reflink=auto",
+            "--",
+            str(src),
+            str(dst),
+            stderr=asyncio.subprocess.PIPE,
+        )
+        _, stderr = await process.communicate()
+        if process.returncode == 0:
+            return
+        logger.warning(
+            "Failed to snapshot '%s' with cp (exit %d): %s",
+            src,
+            process.returncode,
+            stderr.decode(errors="replace").strip(),
+        )
+        if await anyio.Path(dst).exists():
+            await _fast_rmtree(dst)
+
+    await asyncio.to_thread(shutil.copytree, src, dst, symlinks=True)
+
+
+async def _send_progress(
     hikari_client: hikari.GatewayBot,
     ctx: arc.GatewayContext,
     message: str,
+    previous: asyncio.Task[None] | None,
 ) -> None:
+    if previous is not None:
+        await asyncio.wait([previous])
     with contextlib.suppress(Exception):
         await reply_ok(hikari_client, ctx, message, title=None)
 
 
+def _progress(
+    hikari_client: hikari.GatewayBot,
+    ctx: arc.GatewayContext,
+    message: str,
+    previous: asyncio.Task[None] | None = None,
+) -> asyncio.Task[None]:
+    return asyncio.create_task(
+        _send_progress(hikari_client, ctx, message, previous),
+    )
+
+
+async def _announce_update_start(
+    ctx: arc.GatewayContext,
+    embed: hikari.Embed,
+) -> None:
+    try:
+        await dm_role_members(ctx, embeds=[embed])
+    except Exception:
+        logger.exception("Failed to send module update start notification")
+
+
+async def _announce_update_complete(
+    hikari_client: hikari.GatewayBot,
+    module: str,
+    executor: hikari.User,
+) -> None:
+    try:
+        completion_embed = await reply_embed(
+            hikari_client,
+            "Module Updated",
+            f"`{module}` updated by {executor.mention}.",
+        )
+        await dm_role_members(embeds=[completion_embed])
+    except Exception:
+        logger.exception("Failed to send module update completion notification")
+
+
+def _has_tracked_changes(module_dir: pathlib.Path) -> bool:
+    repo = pygit2.Repository(str(module_dir))
+    return bool(repo.status(untracked_files="no"))
+
+
+def _write_local_patch(module_dir: pathlib.Path, destination: pathlib.Path) -> bool:
+    repo = pygit2.Repository(str(module_dir))
+    written = 0
+    with destination.open("wb") as patch_file:
+        for patch in repo.diff():
+            if patch is not None:
+                written += patch_file.write(patch.data)
+    if not written:
+        destination.unlink(missing_ok=True)
+    return written > 0
+
+
 async def _create_backup(
     module: str,
     module_dir: pathlib.Path,
     backup_base: pathlib.Path,
+    original_commit_id: pygit2.Oid | None,
 ) -> tuple[bool, str | None, bool, pygit2.Oid | None]:
     patch_path: str | None = None
     has_local_changes = False
-    original_commit_id: pygit2.Oid | None = None
-    backup_base_async = anyio.Path(backup_base)
 
     try:
         BACKUP_DIR.mkdir(exist_ok=True)
-        if await backup_base_async.exists():
-            await asyncio.to_thread(shutil.rmtree, backup_base, ignore_errors=False)
+        if await anyio.Path(backup_base).exists():
+            await _fast_rmtree(backup_base)
 
-        await asyncio.to_thread(shutil.copytree, module_dir, backup_base, symlinks=True)
+        dirty, _ = await asyncio.gather(
+            asyncio.to_thread(_has_tracked_changes, module_dir),
+            _snapshot_or_copy(module_dir, backup_base),
+        )
         logger.info("Created backup of module '%s' at '%s'", module, backup_base)
 
-        repo = pygit2.Repository(str(module_dir))
-        if not repo.head_is_unborn and isinstance(repo.head.target, pygit2.Oid):
-            original_commit_id = repo.head.target
-        diff = repo.diff()
-        if diff.patch:
+        patch_candidate = backup_base / "local_changes.patch"
+        if dirty and await asyncio.to_thread(
+            _write_local_patch,
+            module_dir,
+            patch_candidate,
+        ):
             has_local_changes = True
-            patch_candidate = backup_base_async / "local_changes.patch"
-            await patch_candidate.write_text(diff.patch, encoding="utf-8")
             patch_path = str(patch_candidate)
             logger.info(
                 "Saved local changes patch for '%s' to '%s'",
@@ -110,14 +242,12 @@ async def _restore_backup(
 
     try:
         if await module_dir_async.exists():
-            await aioshutil.rmtree(module_dir_async)
-        await aioshutil.copytree(backup_base_async, module_dir_async, symlinks=True)
+            await _fast_rmtree(module_dir)
+        await _snapshot_or_copy(backup_base, module_dir)
 
         if original_commit_id is not None:
             try:
                 repo = pygit2.Repository(str(module_dir))
-                from pygit2.enums import ResetMode
-
                 repo.reset(original_commit_id, ResetMode.HARD)
                 logger.info(
                     "Reset module '%s' to original commit %s",
@@ -138,10 +268,112 @@ async def _cleanup_backup(backup_base: pathlib.Path) -> None:
     backup_base_async = anyio.Path(backup_base)
     with contextlib.suppress(Exception):
         if await backup_base_async.exists():
-            await aioshutil.rmtree(backup_base_async)
+            await _fast_rmtree(backup_base)
             logger.info("Cleaned up backup '%s'", backup_base)
 
 
+class _UpdateError(Exception):
+    def __init__(self, message: str, *, reload_restored: bool = False) -> None:
+        super().__init__(message)
+        self.reload_restored = reload_restored
+
+
+async def _roll_back(
+    hikari_client: hikari.GatewayBot,
+    module: str,
+    module_dir: pathlib.Path,
+    backup_base: pathlib.Path,
+    original_commit_id: pygit2.Oid | None,
+    error: _UpdateError,
+) -> str:
+    if not await _restore_backup(module, module_dir, backup_base, original_commit_id):
+        return f"{error}. CRITICAL: Backup restoration failed. Manual intervention required."
+    if not error.reload_restored:
+        return f"{error}. Restored from backup."
+
+    logger.info("Loading restored version of module '%s'", module)
+    if await registry.load_module(hikari_client, module, is_reload=False):
+        return f"{error}: previous version restored and loaded."
+    return f"{error}: restored from backup but reload failed. Manual intervention required."
+
+
+async def _roll_back_and_clean_up(
+    hikari_client: hikari.GatewayBot,
+    module: str,
+    module_dir: pathlib.Path,
+    backup_base: pathlib.Path,
+    original_commit_id: pygit2.Oid | None,
+    error: _UpdateError,
+) -> str:
+    try:
+        return await _roll_back(
+            hikari_client,
+            module,
+            module_dir,
+            backup_base,
+            original_commit_id,
+            error,
+        )
+    finally:
+        await _cleanup_backup(backup_base)
+
+
+@contextlib.asynccontextmanager
+async def _rollback_on_failure(
+    hikari_client: hikari.GatewayBot,
+    module: str,
+    module_dir: pathlib.Path,
+    backup_base: pathlib.Path,
+    original_commit_id: pygit2.Oid | None,
+) -> AsyncIterator[None]:
+    try:
+        yield
+    except _UpdateError as exc:
+        error = exc
+    except Exception as exc:
+        logger.exception("Failed to update module '%s'", module)
+        error = _UpdateError(
+            f"Failed to update module `{module}`: {exc}",
+            reload_restored=not registry.is_module_loaded(module),
+        )
+    except BaseException:
+        interrupted = _UpdateError(
+            f"Update of `{module}` was interrupted",
+            reload_restored=not registry.is_module_loaded(module),
+        )
+        with contextlib.suppress(Exception):
+            await asyncio.shield(
+                _roll_back_and_clean_up(
+                    hikari_client,
+                    module,
+                    module_dir,
+                    backup_base,
+                    original_commit_id,
+                    interrupted,
+                ),
+            )
+        raise
+    else:
+        return
+
+    message = await _roll_back_and_clean_up(
+        hikari_client,
+        module,
+        module_dir,
+        backup_base,
+        original_commit_id,
+        error,
+    )
+    raise _UpdateError(message) from error
+
+
+def _apply_patch_in_process(module_dir: pathlib.Path, patch_path: str) -> None:
+    patch = pathlib.Path(patch_path).read_text(encoding="utf-8")
+    diff = pygit2.Diff.parse_diff(patch)
+    repo = pygit2.Repository(str(module_dir))
+    repo.apply(diff, ApplyLocation.WORKDIR)
+
+
 async def _apply_local_patch(
     hikari_client: hikari.GatewayBot,
     ctx: arc.GatewayContext,
@@ -150,6 +382,18 @@ async def _apply_local_patch(
     patch_path: str,
 ) -> None:
     logger.info("Reapplying local changes from '%s'", patch_path)
+    try:
+        await asyncio.to_thread(_apply_patch_in_process, module_dir, patch_path)
+    except Exception:
+        logger.info(
+            "libgit2 could not apply patch for '%s' cleanly, falling back to git apply",
+            module,
+        )
+    else:
+        logger.info("Reapplied local changes for '%s'", module)
+        await reply_ok(hikari_client, ctx, "Reapplied local changes.", title=None)
+        return
+
     try:
         process = await asyncio.create_subprocess_exec(
             "git",
@@ -158,17 +402,14 @@ async def _apply_local_patch(
             "--whitespace=fix",
             patch_path,
             cwd=str(module_dir),
-            stdout=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.DEVNULL,
             stderr=asyncio.subprocess.PIPE,
         )
-        stdout, stderr = await process.communicate()
-        stdout_str = stdout.decode(errors="ignore").strip()
-        stderr_str = stderr.decode(errors="ignore").strip()
+        _, stderr = await process.communicate()
+        stderr_str = stderr.decode(errors="ignore").strip() if stderr else ""
 
         if process.returncode == 0:
             logger.info("Reapplied local changes for '%s'", module)
-            if stdout_str:
-                logger.info("Git apply stdout: %s", stdout_str)
             if stderr_str:
                 logger.info("Git apply stderr: %s", stderr_str)
             await reply_ok(hikari_client, ctx, "Reapplied local changes.", title=None)
@@ -179,8 +420,6 @@ async def _apply_local_patch(
             module,
             process.returncode,
         )
-        if stdout_str:
-            logger.exception("Git apply stdout: %s", stdout_str)
         if stderr_str:
             logger.exception("Git apply stderr: %s", stderr_str)
         await reply_err(
@@ -199,14 +438,19 @@ async def _apply_local_patch(
 
 
 def _changelog_text(module_dir: pathlib.Path) -> str:
-    changelog_path = module_dir / "CHANGELOG"
-    if not changelog_path.is_file():
-        return "No changelog provided."
-    with contextlib.suppress(Exception):
-        return changelog_path.read_text(encoding="utf-8", errors="ignore")
+    with (
+        contextlib.suppress(Exception),
+        (module_dir / "CHANGELOG").open(encoding="utf-8", errors="ignore") as changelog,
+    ):
+        return changelog.read(_MAX_CHANGELOG_TOTAL_LEN)
     return "No changelog provided."
 
 
+def _changelog_chunks(text: str) -> Iterator[str]:
+    for index in range(0, len(text), _MAX_CHANGELOG_FIELD_LEN):
+        yield text[index : index + _MAX_CHANGELOG_FIELD_LEN]
+
+
 async def cmd_module_update(
     ctx: arc.GatewayContext,
     module: str,
@@ -229,7 +473,10 @@ async def cmd_module_update(
         await reply_err(hikari_client, ctx, f"Directory `{module}` not found.")
         return
 
-    info, valid_info = get_module_info(module)
+    info, valid_info = await get_module_info_async(
+        module,
+        max_fetch_age=_FETCH_MAX_AGE,
+    )
     if not valid_info or not info:
         await reply_err(
             hikari_client,
@@ -242,12 +489,12 @@ async def cmd_module_update(
         info.local_commit
         and info.remote_commit
         and info.local_commit.id == info.remote_commit.id
-        and info.uncommitted_changes == 0
+        and info.divergent_commits == 0
     ):
         await reply_ok(
             hikari_client,
             ctx,
-            f"Module `{module}` already up-to-date (no local modifications).",
+            f"Module `{module}` already up-to-date (in sync with remote).",
         )
         return
 
@@ -255,11 +502,11 @@ async def cmd_module_update(
     target_commit_id = _commit_id(info.remote_commit)
 
     logger.info(
-        "Initiated update for module %s: cur=%s target=%s uncommitted_changes=%d",
+        "Initiated update for module %s: cur=%s target=%s divergent_commits=%d",
         module,
         current_commit_id,
         target_commit_id,
-        info.uncommitted_changes,
+        info.divergent_commits,
     )
 
     embed = await reply_embed(
@@ -271,25 +518,29 @@ async def cmd_module_update(
     embed.url = info.url
     embed.add_field(name="Current Commit", value=f"`{current_commit_id}`", inline=True)
     embed.add_field(name="Target Commit", value=f"`{target_commit_id}`", inline=True)
-    if info.uncommitted_changes > 0:
-        embed.add_field(name="Warning", value="Local modifications detected!")
+    if info.divergent_commits > 0:
+        embed.add_field(
+            name="Warning",
+            value=f"Local branch is {info.divergent_commits} commit(s) ahead/behind remote!",
+        )
     if ctx.member:
         embed.set_author(
             name=ctx.member.display_name,
             icon=ctx.member.display_avatar_url,
         )
-    try:
-        await dm_role_members(ctx, embeds=[embed])
-    except Exception:
-        logger.exception("Failed to send module update start notification")
 
-    await _progress(hikari_client, ctx, f"Backing up module `{module}`.")
-    backup_ok, patch_path, has_local_changes, original_commit_id = await _create_backup(
-        module,
-        module_dir,
-        backup_base,
+    progress = _progress(hikari_client, ctx, f"Backing up module `{module}`.")
+    _, (backup_ok, patch_path, has_local_changes, original_commit_id) = await asyncio.gather(
+        _announce_update_start(ctx, embed),
+        _create_backup(
+            module,
+            module_dir,
+            backup_base,
+            info.local_commit.id if info.local_commit else None,
+        ),
     )
     if not backup_ok:
+        await asyncio.wait([progress])
         await reply_err(
             hikari_client,
             ctx,
@@ -297,100 +548,68 @@ async def cmd_module_update(
         )
         return
 
-    await _progress(hikari_client, ctx, f"Pulling updates for module `{module}`.")
-    pull_result = await asyncio.to_thread(pull_module, module)
-
-    if pull_result != 0:
-        error_reasons = {
-            1: "Cannot update the main repo using this command.",
-            2: "Failed to fetch or apply remote changes.",
-            3: "Master branch not found or checkout failed.",
-        }
-        error_msg = error_reasons.get(pull_result, "Git pull failed with unknown error")
-        logger.exception(
-            "Failed to pull updates for module '%s': %s (%s)",
+    try:
+        async with _rollback_on_failure(
+            hikari_client,
             module,
-            error_msg,
-            pull_result,
-        )
-        if await _restore_backup(module, module_dir, backup_base, original_commit_id):
-            await reply_err(
-                hikari_client,
-                ctx,
-                f"Failed to update module: {error_msg}. Restored from backup.",
-            )
-        else:
-            await reply_err(
+            module_dir,
+            backup_base,
+            original_commit_id,
+        ):
+            progress = _progress(
                 hikari_client,
                 ctx,
-                f"Failed to update module: {error_msg}. CRITICAL: Backup restoration failed. Manual intervention required.",
+                f"Pulling updates for module `{module}`.",
+                progress,
             )
-        await _cleanup_backup(backup_base)
-        return
-
-    await _progress(hikari_client, ctx, f"Updating dependencies for `{module}`.")
-    pip_success = await asyncio.to_thread(
-        run_pip,
-        str(module_dir / "requirements.txt"),
-        install=True,
-    )
+            pull_result = await asyncio.to_thread(pull_module, module)
+            if pull_result != 0:
+                error_msg = _PULL_ERRORS.get(
+                    pull_result,
+                    "Git pull failed with unknown error",
+                )
+                logger.exception(
+                    "Failed to pull updates for module '%s': %s (%s)",
+                    module,
+                    error_msg,
+                    pull_result,
+                )
+                raise _UpdateError(f"Failed to update module: {error_msg}")
 
-    if not pip_success:
-        logger.exception("Failed to update dependencies for module '%s'", module)
-        if await _restore_backup(module, module_dir, backup_base, original_commit_id):
-            await reply_err(
-                hikari_client,
-                ctx,
-                f"Failed to update dependencies for `{module}`. Restored from backup.",
-            )
-        else:
-            await reply_err(
+            progress = _progress(
                 hikari_client,
                 ctx,
-                f"Failed to update dependencies for `{module}`. CRITICAL: Backup restoration failed. Manual intervention required.",
-            )
-        await _cleanup_backup(backup_base)
-        return
-
-    await _progress(hikari_client, ctx, f"Validating and reloading module `{module}`.")
-    reload_success = await registry.load_module(hikari_client, module, is_reload=True)
-
-    if not reload_success:
-        logger.exception("Failed to reload module '%s' after update", module)
-        if await _restore_backup(module, module_dir, backup_base, original_commit_id):
-            logger.info("Loading restored version of module '%s'", module)
-            final_load_success = await registry.load_module(
-                hikari_client,
-                module,
-                is_reload=False,
+                f"Updating dependencies for `{module}`.",
+                progress,
             )
+            if not await run_pip(str(module_dir / "requirements.txt"), install=True):
+                logger.exception("Failed to update dependencies for module '%s'", module)
+                raise _UpdateError(f"Failed to update dependencies for `{module}`")
 
-            if final_load_success:
-                await reply_err(
-                    hikari_client,
-                    ctx,
-                    f"Failed to reload updated module `{module}`: previous version restored and loaded.",
-                )
-            else:
-                await reply_err(
-                    hikari_client,
-                    ctx,
-                    f"Failed to reload updated module `{module}`: restored from backup but reload failed. Manual intervention required.",
-                )
-        else:
-            await reply_err(
+            progress = _progress(
                 hikari_client,
                 ctx,
-                f"Failed to reload updated module `{module}`. CRITICAL: Backup restoration failed. Manual intervention required.",
+                f"Validating and reloading module `{module}`.",
+                progress,
             )
-        await _cleanup_backup(backup_base)
+            if not await registry.load_module(hikari_client, module, is_reload=True):
+                logger.exception("Failed to reload module '%s' after update", module)
+                raise _UpdateError(
+                    f"Failed to reload updated module `{module}`",
+                    reload_restored=True,
+                )
+    except _UpdateError as exc:
+        await asyncio.wait([progress])
+        await reply_err(hikari_client, ctx, str(exc))
         return
 
+    await asyncio.wait([progress])
     if has_local_changes and patch_path and await anyio.Path(patch_path).exists():
         await _apply_local_patch(hikari_client, ctx, module, module_dir, patch_path)
 
     try:
-        changelog_content = _changelog_text(module_dir)
+        changelog_text = await asyncio.to_thread(_changelog_text, module_dir)
+        changelog_content = changelog_text.strip() or "No CHANGELOG available."
 
         result_embed = await reply_embed(
             hikari_client,
@@ -398,21 +617,14 @@ async def cmd_module_update(
             f"Updated module `{module}` to commit `{target_commit_id[:7]}`.",
         )
 
-        max_field_len = 1000
-        changelog_chunks = [
-            changelog_content[i : i + max_field_len]
-            for i in range(0, len(changelog_content), max_field_len)
-        ]
-
-        for i, chunk in enumerate(changelog_chunks):
+        total = -(-len(changelog_content) // _MAX_CHANGELOG_FIELD_LEN)
+        for i, chunk in enumerate(_changelog_chunks(changelog_content)):
             field_name = (
-                "CHANGELOG"
-                if len(changelog_chunks) == 1
-                else f"CHANGELOG (Part {i + 1}/{len(changelog_chunks)})"
+                "CHANGELOG" if total == 1 else f"CHANGELOG (Part {i + 1}/{total})"
             )
             result_embed.add_field(
                 name=field_name,
-                value=f"```md\n{chunk.strip() or 'No CHANGELOG available.'}\n```",
+                value=f"```md\n{chunk}\n```",
             )
 
         buttons: list[nav.NavItem] = [
@@ -441,15 +653,9 @@ async def cmd_module_update(
             ctx,
             f"Updated `{module}` but failed to display details.",
         )
+        await _cleanup_backup(backup_base)
     else:
-        try:
-            completion_embed = await reply_embed(
-                hikari_client,
-                "Module Updated",
-                f"`{module}` updated by {executor.mention}.",
-            )
-            await dm_role_members(embeds=[completion_embed])
-        except Exception:
-            logger.exception("Failed to send module update completion notification")
-
-    await _cleanup_backup(backup_base)
+        await asyncio.gather(
+            _announce_update_complete(hikari_client, module, executor),
+            _cleanup_backup(backup_base),
+        )
@@ -49,7 +49,7 @@ class Container:
 
 
 _container: Container | None = None
-_container_lock = threading.RLock()
+_container_lock = threading.Lock()
 
 
 def init_app(
@@ -59,21 +59,22 @@ def init_app(
 ) -> Container:
     global _container
     with _container_lock:
-        _container = Container(
+        container = Container(
             hikari_client=hikari_client,
             arc_client=arc_client,
             miru_client=miru_client,
         )
-        _container.mark_initialized()
-        return _container
+        container.mark_initialized()
+        _container = container
+        return container
 
 
 def get_app() -> Container:
-    with _container_lock:
-        if _container is None:
-            msg = "Application container not initialized"
-            raise RuntimeError(msg)
-        return _container
+    container = _container
+    if container is None:
+        msg = "Application container not initialized"
+        raise RuntimeError(msg)
+    return container
 
 
 def get_hikari() -> hikari.GatewayBot:
@@ -17,4 +17,5 @@ def _discover_main_repo_path() -> str | None:
 GIT_URL_TRANS_MAP: Final[dict[int, str]] = str.maketrans(
     {"_": "_u_", "/": "_s_", ".": "_d_", "-": "_h_"},
 )
+VALID_REPO_MARKER: Final[str] = "kernel-module"
 MAIN_REPO_PATH: Final[str | None] = _discover_main_repo_path()
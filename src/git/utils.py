@@ -1,26 +1,60 @@
 from __future__ import annotations
 
+import asyncio
 import contextlib
 import dataclasses
 import datetime
 import functools
+import os
+import pathlib
 import shutil
+import time
 from typing import TYPE_CHECKING, Final
 from urllib.parse import urlsplit
 
 import pygit2
 
-from src.git.constants import GIT_URL_TRANS_MAP, MAIN_REPO_PATH
+from src.git.constants import GIT_URL_TRANS_MAP, MAIN_REPO_PATH, VALID_REPO_MARKER
 from src.shared.constants import EXTENSIONS_DIR
+from src.shared.logger import logger
 
 if TYPE_CHECKING:
-    import pathlib
+    from collections.abc import Sequence
 
 _REF_NAMES: Final[tuple[str, ...]] = (
     "refs/remotes/origin/HEAD",
     "refs/remotes/origin/main",
     "refs/remotes/origin/master",
 )
+_KERNEL_INFO_TTL: Final[float] = 30.0
+_SHORT_ID_LEN: Final[int] = 10
+_CLONE_DEPTH: Final[int] = 1
+_INFO_CONCURRENCY: Final[int] = 8
+_IGNORED_NETLOC_PARTS: Final[frozenset[str]] = frozenset({"www", "com"})
+
+_kernel_info_cache: tuple[float, RepoInfo] | None = None
+_discovered_repos: dict[str, str] = {}
+
+
+def _discover(module_path_str: str) -> str | None:
+    cached = _discovered_repos.get(module_path_str)
+    if cached is not None and os.path.isdir(cached):
+        return cached
+
+    repo_path = pygit2.discover_repository(module_path_str)
+    if repo_path and repo_path.startswith(os.path.join(module_path_str, "")):
+        _discovered_repos[module_path_str] = repo_path
+    else:
+        _discovered_repos.pop(module_path_str, None)
+    return repo_path
+
+
+def invalidate_repo_discovery() -> None:
+    _discovered_repos.clear()
+
+
+def discover_module_repo(name: str) -> str | None:
+    return _discover(str(EXTENSIONS_DIR / name))
 
 
 def _open_repo(repo_path_str: str) -> pygit2.Repository | None:
@@ -37,9 +71,13 @@ def _get_origin(repo: pygit2.Repository) -> pygit2.Remote | None:
         return None
 
 
-def _fetch_origin(origin: pygit2.Remote) -> None:
-    with contextlib.suppress(Exception):
+def _fetch_origin(origin: pygit2.Remote) -> bool:
+    try:
         origin.fetch()
+    except Exception:
+        logger.exception("Failed to fetch from remote '%s'", origin.url)
+        return False
+    return True
 
 
 def resolve_remote_ref(repo: pygit2.Repository) -> pygit2.Reference | None:
@@ -78,28 +116,33 @@ def resolve_local_ref(
 
 @dataclasses.dataclass(slots=True, frozen=True, kw_only=True)
 class RepoInfo:
-    uncommitted_changes: int
+    divergent_commits: int
     url: str
     local_commit: pygit2.Commit | None = None
     remote_commit: pygit2.Commit | None = None
     changelog: str = ""
+    short_id: str = dataclasses.field(init=False, default="N/A")
+    remote_short_id: str = dataclasses.field(init=False, default="N/A")
 
     def __post_init__(self) -> None:
-        if self.uncommitted_changes < 0:
-            msg = f"uncommitted_changes must be non-negative, got {self.uncommitted_changes}"
+        if self.divergent_commits < 0:
+            msg = f"divergent_commits must be non-negative, got {self.divergent_commits}"
             raise ValueError(msg)
+        if self.local_commit is not None:
+            object.__setattr__(self, "short_id", str(self.local_commit.id)[:_SHORT_ID_LEN])
+        if self.remote_commit is not None:
+            object.__setattr__(
+                self,
+                "remote_short_id",
+                str(self.remote_commit.id)[:_SHORT_ID_LEN],
+            )
 
     @staticmethod
-    @functools.lru_cache(maxsize=1024)
-    def _ts(commit_time: int, offset: int) -> float:
-        return commit_time + offset * 60
-
-    @classmethod
-    def _format_time(cls, commit: pygit2.Commit | None) -> str | None:
+    def _format_time(commit: pygit2.Commit | None) -> str | None:
         if commit is None:
             return None
         return datetime.datetime.fromtimestamp(
-            cls._ts(commit.commit_time, commit.committer.offset),
+            commit.commit_time + commit.committer.offset * 60,
             datetime.timezone.utc,
         ).isoformat()
 
@@ -112,6 +155,13 @@ class RepoInfo:
         return self._format_time(self.remote_commit)
 
 
+@functools.lru_cache(maxsize=64)
+def _netloc_slug(netloc: str) -> str:
+    return ".".join(
+        part for part in netloc.split(".") if part not in _IGNORED_NETLOC_PARTS
+    ).translate(GIT_URL_TRANS_MAP)
+
+
 def parse_repo_url(url: str) -> tuple[str, str, bool]:
     parsed = urlsplit(url)
     if (
@@ -122,22 +172,15 @@ def parse_repo_url(url: str) -> tuple[str, str, bool]:
     ):
         return url, "", False
 
-    netloc_parts = parsed.netloc.split(".")
-    relevant_netloc = ".".join(
-        part for part in netloc_parts if part not in frozenset({"www", "com"})
-    )
-    if not relevant_netloc:
+    netloc_slug = _netloc_slug(parsed.netloc)
+    if not netloc_slug:
         return url, "", False
 
     path_part = parsed.path.removesuffix(".git").removeprefix("/")
     if not path_part:
         return url, "", False
 
-    return (
-        url,
-        f"{relevant_netloc.translate(GIT_URL_TRANS_MAP)}__{path_part.translate(GIT_URL_TRANS_MAP)}",
-        True,
-    )
+    return url, f"{netloc_slug}__{path_part.translate(GIT_URL_TRANS_MAP)}", True
 
 
 def clone_repo(url: str) -> tuple[str, bool]:
@@ -149,10 +192,15 @@ def clone_repo(url: str) -> tuple[str, bool]:
     EXTENSIONS_DIR.mkdir(parents=True, exist_ok=True)
 
     try:
-        pygit2.clone_repository(url, str(repo_path))
+        repo = pygit2.clone_repository(url, str(repo_path), depth=_CLONE_DEPTH)
     except Exception:
         shutil.rmtree(repo_path, ignore_errors=True)
         return "", False
+    finally:
+        invalidate_repo_discovery()
+
+    with contextlib.suppress(OSError):
+        (pathlib.Path(repo.path) / VALID_REPO_MARKER).touch()
 
     return repo_name, True
 
@@ -163,11 +211,9 @@ def pull_repo(repo_path_str: str) -> int:
         return 2
 
     origin = _get_origin(repo)
-    if origin is None:
+    if origin is None or not _fetch_origin(origin):
         return 2
 
-    _fetch_origin(origin)
-
     remote_ref = resolve_remote_ref(repo)
     if remote_ref is None:
         return 3
@@ -190,12 +236,26 @@ def pull_repo(repo_path_str: str) -> int:
     return 0
 
 
+def has_valid_marker(module_path: str) -> bool:
+    return os.path.isfile(os.path.join(module_path, ".git", VALID_REPO_MARKER))
+
+
+def is_valid_repo_entry(entry: os.DirEntry[str]) -> bool:
+    if has_valid_marker(entry.path) or os.path.isfile(
+        os.path.join(entry.path, "package.json"),
+    ):
+        return True
+
+    module_repo_path = pygit2.discover_repository(entry.path)
+    return bool(module_repo_path and module_repo_path != MAIN_REPO_PATH)
+
+
 def is_valid_repo(name: str) -> bool:
     module_path = EXTENSIONS_DIR / name
     if (module_path / "package.json").is_file():
         return True
 
-    module_repo_path = pygit2.discover_repository(str(module_path))
+    module_repo_path = _discover(str(module_path))
     return bool(module_repo_path and module_repo_path != MAIN_REPO_PATH)
 
 
@@ -215,18 +275,41 @@ def _resolve_commits(
     return head_commit, remote_commit
 
 
-def get_repo_commits(
+def _divergence(repo: pygit2.Repository, local: pygit2.Oid, remote: pygit2.Oid) -> int:
+    if local == remote:
+        return 0
+    try:
+        ahead, behind = repo.ahead_behind(local, remote)
+    except pygit2.GitError:
+        return 1
+    return ahead + behind
+
+
+def _fetched_within(repo: pygit2.Repository, max_age: float) -> bool:
+    if max_age <= 0:
+        return False
+    try:
+        fetched_at = os.stat(os.path.join(repo.path, "FETCH_HEAD")).st_mtime
+    except OSError:
+        return False
+    return time.time() - fetched_at < max_age
+
+
+def _inspect_repo(
     repo_path_str: str,
-) -> tuple[pygit2.Commit | None, pygit2.Commit | None, int] | None:
+    *,
+    max_fetch_age: float = 0.0,
+) -> tuple[pygit2.Commit | None, pygit2.Commit | None, int, str] | None:
     repo = _open_repo(repo_path_str)
     if repo is None:
         return None
 
     origin = _get_origin(repo)
-    if origin is None:
+    if origin is None or not origin.url:
         return None
 
-    _fetch_origin(origin)
+    if not _fetched_within(repo, max_fetch_age):
+        _fetch_origin(origin)
 
     remote_ref = resolve_remote_ref(repo)
     if remote_ref is None:
@@ -234,54 +317,49 @@ def get_repo_commits(
 
     head_commit, remote_commit = _resolve_commits(repo, remote_ref)
 
-    modifications = (
+    divergence = (
         -1
         if remote_commit is None or head_commit is None
-        else repo.diff(head_commit.id, remote_commit.id).stats.files_changed
+        else _divergence(repo, head_commit.id, remote_commit.id)
     )
 
-    return head_commit, remote_commit, modifications
+    return head_commit, remote_commit, divergence, origin.url
 
 
-def _origin_url(repo_path_str: str) -> str | None:
-    repo = _open_repo(repo_path_str)
-    if repo is None:
-        return None
-
-    origin = _get_origin(repo)
-    if origin is None:
+def get_repo_commits(
+    repo_path_str: str,
+) -> tuple[pygit2.Commit | None, pygit2.Commit | None, int] | None:
+    inspected = _inspect_repo(repo_path_str)
+    if inspected is None:
         return None
-
-    return origin.url
+    head_commit, remote_commit, divergence, _ = inspected
+    return head_commit, remote_commit, divergence
 
 
 def _read_changelog(module_path: pathlib.Path) -> str:
-    changelog_path = module_path / "CHANGELOG"
-    if not changelog_path.is_file():
-        return ""
-
     with contextlib.suppress(Exception):
-        return changelog_path.read_text(encoding="utf-8", errors="ignore")
+        return (module_path / "CHANGELOG").read_text(encoding="utf-8", errors="ignore")
     return ""
 
 
-def get_module_info(name: str) -> tuple[RepoInfo | None, bool]:
+def get_module_info(
+    name: str,
+    *,
+    max_fetch_age: float = 0.0,
+) -> tuple[RepoInfo | None, bool]:
     module_path = EXTENSIONS_DIR / name
-    repo_path_str = pygit2.discover_repository(str(module_path))
+    repo_path_str = _discover(str(module_path))
     if not repo_path_str or repo_path_str == MAIN_REPO_PATH:
         return None, False
 
-    commits = get_repo_commits(repo_path_str)
-    if commits is None:
+    inspected = _inspect_repo(repo_path_str, max_fetch_age=max_fetch_age)
+    if inspected is None:
         return None, False
 
-    head_commit, remote_commit, modifications = commits
-    origin_url = _origin_url(repo_path_str)
-    if not origin_url:
-        return None, False
+    head_commit, remote_commit, divergence, origin_url = inspected
 
     return RepoInfo(
-        uncommitted_changes=modifications,
+        divergent_commits=divergence,
         url=origin_url,
         local_commit=head_commit,
         remote_commit=remote_commit,
@@ -289,22 +367,62 @@ def get_module_info(name: str) -> tuple[RepoInfo | None, bool]:
     ), True
 
 
-def get_kernel_info() -> RepoInfo | None:
+async def get_module_info_async(
+    name: str,
+    *,
+    max_fetch_age: float = 0.0,
+) -> tuple[RepoInfo | None, bool]:
+    return await asyncio.to_thread(get_module_info, name, max_fetch_age=max_fetch_age)
+
+
+async def get_all_modules_info(
+    names: Sequence[str],
+) -> list[tuple[RepoInfo | None, bool] | BaseException]:
+    semaphore = asyncio.Semaphore(_INFO_CONCURRENCY)
+
+    async def fetch(name: str) -> tuple[RepoInfo | None, bool]:
+        async with semaphore:
+            return await get_module_info_async(name)
+
+    return await asyncio.gather(
+        *(fetch(name) for name in names),
+        return_exceptions=True,
+    )
+
+
+def _load_kernel_info() -> RepoInfo | None:
     if not MAIN_REPO_PATH:
         return None
 
-    commits = get_repo_commits(MAIN_REPO_PATH)
-    if commits is None:
+    inspected = _inspect_repo(MAIN_REPO_PATH)
+    if inspected is None:
         return None
 
-    head_commit, remote_commit, modifications = commits
-    origin_url = _origin_url(MAIN_REPO_PATH)
-    if not origin_url:
-        return None
+    head_commit, remote_commit, divergence, origin_url = inspected
 
     return RepoInfo(
-        uncommitted_changes=modifications,
+        divergent_commits=divergence,
         url=origin_url,
         local_commit=head_commit,
         remote_commit=remote_commit,
     )
+
+
+def invalidate_kernel_info() -> None:
+    global _kernel_info_cache
+    _kernel_info_cache = None
+
+
+def get_kernel_info(*, force: bool = False) -> RepoInfo | None:
+    global _kernel_info_cache
+    now = time.monotonic()
+    if (
+        not force
+        and _kernel_info_cache is not None
+        and now - _kernel_info_cache[0] < _KERNEL_INFO_TTL
+    ):
+        return _kernel_info_cache[1]
+
+    info = _load_kernel_info()
+    _kernel_info_cache = None if info is None else (now, info)
+    return info
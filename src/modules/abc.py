@@ -51,7 +51,7 @@ class Module(abc.ABC):
     ) -> Result: ...
 
     @abc.abstractmethod
-    async def unload(self) -> Result: ...
+    async def unload(self, *, resync: bool = True) -> Result: ...
 
     @abc.abstractmethod
     def get_info(self) -> dict[str, object]: ...
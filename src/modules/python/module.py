@@ -15,19 +15,26 @@ from src.shared.logger import logger
 if typing.TYPE_CHECKING:
     import pathlib
     import types
-    from collections.abc import Iterable
 
     import arc
     import hikari
 
 
 class PythonModule(Module):
-    __slots__ = ("_backup_modules", "_module_full_name", "_state_lock")
+    __slots__ = (
+        "_backup_modules",
+        "_module_full_name",
+        "_owned_names",
+        "_state_lock",
+        "_submodule_prefix",
+    )
 
     def __init__(self, name: str, path: pathlib.Path) -> None:
         super().__init__(name, path)
-        self._module_full_name: str = f"extensions.{name}.main"
+        self._module_full_name: str = sys.intern(f"extensions.{name}.main")
+        self._submodule_prefix: str = sys.intern(f"{self._module_full_name}.")
         self._backup_modules: dict[str, types.ModuleType] = {}
+        self._owned_names: set[str] = set()
         self._state_lock = asyncio.Lock()
 
     @property
@@ -44,31 +51,29 @@ class PythonModule(Module):
         info["has_requirements"] = reqs_file.is_file()
         return info
 
-    def _submodule_prefix(self) -> str:
-        return f"{self._module_full_name}."
-
     def _is_owned_module_name(self, module_name: str) -> bool:
         return module_name == self._module_full_name or module_name.startswith(
-            self._submodule_prefix(),
+            self._submodule_prefix,
         )
 
-    def _iter_owned_module_names(self) -> Iterable[str]:
-        return (
+    def _track_new_modules(self, before: set[str]) -> None:
+        self._owned_names.update(
             module_name
-            for module_name in tuple(sys.modules.keys())
+            for module_name in sys.modules.keys() - before
             if self._is_owned_module_name(module_name)
         )
 
     def _capture_loaded_modules(self) -> dict[str, types.ModuleType]:
         return {
             module_name: module_obj
-            for module_name, module_obj in sys.modules.items()
-            if self._is_owned_module_name(module_name)
+            for module_name in self._owned_names
+            if (module_obj := sys.modules.get(module_name)) is not None
         }
 
     def _purge_loaded_modules(self) -> None:
-        for module_name in self._iter_owned_module_names():
+        for module_name in self._owned_names:
             sys.modules.pop(module_name, None)
+        self._owned_names.clear()
 
     @staticmethod
     async def _resync_commands_if_started(arc_client: arc.GatewayClient) -> None:
@@ -77,7 +82,11 @@ class PythonModule(Module):
 
     async def _load_extension(self, *, resync: bool = True) -> None:
         arc_client = get_arc()
-        arc_client.load_extension(self._module_full_name)
+        before = set(sys.modules)
+        try:
+            arc_client.load_extension(self._module_full_name)
+        finally:
+            self._track_new_modules(before)
         if resync:
             await self._resync_commands_if_started(arc_client)
 
@@ -133,8 +142,8 @@ class PythonModule(Module):
             with contextlib.suppress(Exception):
                 arc_client.unload_extension(self._module_full_name)
             self._purge_loaded_modules()
-            for module_name, module_obj in backup_submodules.items():
-                sys.modules[module_name] = module_obj
+            sys.modules.update(backup_submodules)
+            self._owned_names.update(backup_submodules)
 
             try:
                 await self._load_extension(resync=True)
@@ -170,17 +179,18 @@ class PythonModule(Module):
                 return await self._reload_extension()
             return await self._load_fresh()
 
-    async def unload(self) -> Result:
+    async def unload(self, *, resync: bool = True) -> Result:
         try:
             async with self._state_lock:
                 await self._unload_extension(resync=False)
                 logger.info("Unloaded extension '%s'", self._module_full_name)
 
-                try:
-                    await self._resync_commands_if_started(get_arc())
-                    logger.info("Resynced commands after extension unload")
-                except Exception:
-                    logger.exception("Failed to resync commands after unload")
+                if resync:
+                    try:
+                        await self._resync_commands_if_started(get_arc())
+                        logger.info("Resynced commands after extension unload")
+                    except Exception:
+                        logger.exception("Failed to resync commands after unload")
 
                 self._set_loaded(False)
                 self._purge_loaded_modules()
@@ -1,72 +1,96 @@
 from __future__ import annotations
 
-import contextlib
-import importlib
+import asyncio
+import functools
 import pathlib
-import typing
+import shutil
+import sys
 
+from src.modules.utils import invalidate_dependency_cache, requirements_satisfied
 from src.shared.logger import logger
 
-PipMain = typing.Callable[[list[str]], int]
-_pip_main: PipMain | None = None
-_pip_main_resolved = False
 
+@functools.cache
+def _uv_executable() -> str | None:
+    return shutil.which("uv")
 
-def _resolve_pip_main() -> PipMain | None:
-    global _pip_main_resolved, _pip_main
-    if _pip_main_resolved:
-        return _pip_main
-    _pip_main_resolved = True
 
-    with contextlib.suppress(Exception):
-        pip_internal = importlib.import_module("pip._internal.cli.main")
-        pip_internal_main = getattr(pip_internal, "main", None)
-        if callable(pip_internal_main):
-            _pip_main = typing.cast("PipMain", pip_internal_main)
-            return _pip_main
+def _pip_command(path: pathlib.Path, *, install: bool) -> list[str]:
+    uv = _uv_executable()
+    if uv is not None:
+        operation = ("install", "--upgrade") if install else ("uninstall",)
+        return [uv, "pip", *operation, "--python", sys.executable, "-r", str(path)]
 
-    with contextlib.suppress(Exception):
-        pip_module = importlib.import_module("pip")
-        pip_module_main = getattr(pip_module, "main", None)
-        if callable(pip_module_main):
-            _pip_main = typing.cast("PipMain", pip_module_main)
-            return _pip_main
+    operation = (
+        ("install", "-U", "--progress-bar", "off") if install else ("uninstall", "-y")
+    )
+    return [
+        sys.executable,
+        "-m",
+        "pip",
+        *operation,
+        "--disable-pip-version-check",
+        "--no-input",
+        "-r",
+        str(path),
+    ]
 
-    logger.critical("Failed to import pip main function")
-    return None
 
-
-def run_pip(file_path: str, *, install: bool = True) -> bool:
-    pip_main = _resolve_pip_main()
-    if pip_main is None:
-        logger.exception(
-            "Failed to process requirements file: pip main function unavailable",
-        )
+def _already_satisfied(path: pathlib.Path) -> bool:
+    try:
+        content = path.read_text(encoding="utf-8")
+    except OSError:
         return False
+    return requirements_satisfied(content)
 
+
+async def run_pip(
+    file_path: str,
+    *,
+    install: bool = True,
+    skip_if_satisfied: bool = False,
+) -> bool:
     path = pathlib.Path(file_path).expanduser().resolve()
     if not path.is_file():
         logger.exception("Failed to locate requirements file: %s", path)
         return False
 
-    operation = ("install", "-U") if install else ("uninstall", "-y")
-    command = [*operation, "-r", str(path)]
+    if (
+        install
+        and skip_if_satisfied
+        and await asyncio.to_thread(_already_satisfied, path)
+    ):
+        logger.info("Requirements in '%s' already satisfied", path)
+        return True
 
+    command = _pip_command(path, install=install)
     try:
-        status_code = pip_main(command)
-        if status_code == 0 or status_code is None:
-            logger.info(
-                "Processed requirements file '%s' with pip %s",
-                path,
-                " ".join(operation),
-            )
-            return True
-        logger.exception(
-            "Failed to process requirements file '%s': pip exited with status %d",
-            path,
-            status_code,
+        process = await asyncio.create_subprocess_exec(
+            *command,
+            stdout=asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.PIPE,
         )
-        return False
+        _, stderr = await process.communicate()
     except Exception:
         logger.exception("Failed to process requirements file '%s'", path)
         return False
+    finally:
+        invalidate_dependency_cache()
+
+    tool = "uv pip" if _uv_executable() is not None else "pip"
+    if process.returncode == 0:
+        logger.info(
+            "Processed requirements file '%s' with %s %s",
+            path,
+            tool,
+            "install" if install else "uninstall",
+        )
+        return True
+    logger.error(
+        "Failed to process requirements file '%s': %s exited with status %d: %s",
+        path,
+        tool,
+        process.returncode,
+        stderr.decode(errors="replace").strip(),
+    )
+    return False
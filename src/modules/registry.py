@@ -3,6 +3,7 @@ from __future__ import annotations
 import asyncio
 import typing
 
+from src.container.app import get_arc
 from src.modules.python.module import PythonModule
 from src.modules.utils import delete_module, detect_module_type
 from src.shared.constants import EXTENSIONS_DIR
@@ -19,12 +20,13 @@ if typing.TYPE_CHECKING:
 
 
 class Registry:
-    __slots__ = ("_lock", "_modules")
+    __slots__ = ("_lock", "_modules", "_reloading")
 
     _RELOAD_DELAY_SECONDS: typing.Final[float] = 0.5
 
     def __init__(self) -> None:
         self._modules: dict[str, Module] = {}
+        self._reloading: set[str] = set()
         self._lock = asyncio.Lock()
 
     @staticmethod
@@ -68,25 +70,8 @@ class Registry:
             return None
         return module_class(name=module_name, path=module_disk_path)
 
-    async def _replace_loaded_module(
-        self,
-        module_name: str,
-        module: Module,
-    ) -> None:
-        async with self._lock:
-            self._modules[module_name] = module
-
-    async def _pop_module(self, module_name: str) -> Module | None:
-        async with self._lock:
-            return self._modules.pop(module_name, None)
-
-    async def _get_module(self, module_name: str) -> Module | None:
-        async with self._lock:
-            return self._modules.get(module_name)
-
-    async def _iter_module_names(self) -> tuple[str, ...]:
-        async with self._lock:
-            return tuple(self._modules.keys())
+    def _iter_module_names(self) -> tuple[str, ...]:
+        return tuple(self._modules)
 
     def get_module(self, module_name: str) -> Module | None:
         return self._modules.get(module_name)
@@ -138,26 +123,30 @@ class Registry:
                     if not deleted:
                         logger.info("Failed to delete invalid module '%s'", module_name)
             if old_module is not None and is_reload:
-                await self._replace_loaded_module(module_name, old_module)
+                async with self._lock:
+                    self._modules[module_name] = old_module
             return False
 
-        await self._replace_loaded_module(module_name, module)
+        async with self._lock:
+            self._modules[module_name] = module
         logger.info("Loaded %s", result.message)
         return True
 
-    async def unload_module(self, module_name: str) -> bool:
-        module = await self._pop_module(module_name)
+    async def unload_module(self, module_name: str, *, resync: bool = True) -> bool:
+        async with self._lock:
+            module = self._modules.pop(module_name, None)
         if module is None:
             return False
 
-        result = await module.unload()
+        result = await module.unload(resync=resync)
         if not result.success:
             logger.exception(
                 "Failed to unload module %s: %s",
                 module_name,
                 result.message,
             )
-            await self._replace_loaded_module(module_name, module)
+            async with self._lock:
+                self._modules.setdefault(module_name, module)
             return False
 
         logger.info("Unloaded %s", result.message)
@@ -168,11 +157,16 @@ class Registry:
         hikari_client: hikari.GatewayBot,
         module_name: str,
     ) -> bool:
-        if await self._get_module(module_name) is None:
-            logger.info("Failed to reload module %s", module_name)
-            return False
+        async with self._lock:
+            if module_name not in self._modules or module_name in self._reloading:
+                logger.info("Failed to reload module %s", module_name)
+                return False
+            self._reloading.add(module_name)
 
-        return await self.load_module(hikari_client, module_name, is_reload=True)
+        try:
+            return await self.load_module(hikari_client, module_name, is_reload=True)
+        finally:
+            self._reloading.discard(module_name)
 
     async def call_method(
         self,
@@ -180,15 +174,27 @@ class Registry:
         method: str,
         payload: dict,
     ) -> dict | None:
-        module = await self._get_module(module_name)
+        module = self._modules.get(module_name)
         if module is None:
             return None
         return await module.call_method(method, payload)
 
     async def unload_all(self) -> None:
-        modules = await self._iter_module_names()
-        for module_name in modules:
-            await self.unload_module(module_name)
+        await asyncio.gather(
+            *(
+                self.unload_module(module_name, resync=False)
+                for module_name in self._iter_module_names()
+            ),
+            return_exceptions=True,
+        )
+
+        arc_client = get_arc()
+        if not arc_client.is_started:
+            return
+        try:
+            await arc_client.resync_commands()
+        except Exception:
+            logger.exception("Failed to resync commands after unloading modules")
 
 
 registry = Registry()
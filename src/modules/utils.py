@@ -1,31 +1,54 @@
 from __future__ import annotations
 
-import ast
 import asyncio
+import contextlib
 import functools
 import importlib.metadata
+import os
 import shutil
+from collections import OrderedDict
 from collections.abc import Sequence
 from pathlib import Path
 
 import anyio
 import pygit2
 from aiofiles import tempfile
+from packaging.requirements import Requirement
+from packaging.utils import canonicalize_name
+from packaging.version import Version
 
 from src.container.types import ModuleType
 from src.git.constants import MAIN_REPO_PATH
-from src.git.utils import is_valid_repo, parse_repo_url, pull_repo
+from src.git.utils import (
+    discover_module_repo,
+    invalidate_kernel_info,
+    invalidate_repo_discovery,
+    is_valid_repo,
+    parse_repo_url,
+    pull_repo,
+)
 from src.shared.constants import EXTENSIONS_DIR
 
 CheckResult = tuple[bool, str, Sequence[str]]
 
+_MODULE_TYPE_CACHE_MAX = 256
+
+_ModuleLayout = tuple[ModuleType | None, bool]
+
+_module_type_cache: OrderedDict[str, tuple[int, _ModuleLayout]] = OrderedDict()
+
 
 def pull_kernel() -> int:
-    return pull_repo(MAIN_REPO_PATH) if MAIN_REPO_PATH else 2
+    if not MAIN_REPO_PATH:
+        return 2
+    try:
+        return pull_repo(MAIN_REPO_PATH)
+    finally:
+        invalidate_kernel_info()
 
 
 def pull_module(name: str) -> int:
-    repo_path = pygit2.discover_repository(str(EXTENSIONS_DIR / name))
+    repo_path = discover_module_repo(name)
     if not repo_path:
         return 2
     if repo_path == MAIN_REPO_PATH:
@@ -39,16 +62,52 @@ def delete_module(name: str) -> bool:
         return False
     try:
         shutil.rmtree(module_path)
-        return True
     except Exception:
         return False
+    finally:
+        invalidate_repo_discovery()
+    return True
+
+
+def _scan_module_layout(module_path: Path) -> _ModuleLayout:
+    files: set[str] = set()
+    with contextlib.suppress(OSError), os.scandir(module_path) as entries:
+        for entry in entries:
+            with contextlib.suppress(OSError):
+                if entry.is_file():
+                    files.add(entry.name)
+
+    module_type = next(
+        (candidate for candidate in ModuleType if candidate.entry_file in files),
+        None,
+    )
+    has_deps = module_type is not None and module_type.dependency_file in files
+    return module_type, has_deps
+
+
+def _module_layout(module_path: Path) -> _ModuleLayout:
+    try:
+        mtime_ns = module_path.stat().st_mtime_ns
+    except OSError:
+        return None, False
+
+    key = str(module_path)
+    cached = _module_type_cache.get(key)
+    if cached is not None and cached[0] == mtime_ns:
+        _module_type_cache.move_to_end(key)
+        return cached[1]
+
+    layout = _scan_module_layout(module_path)
+    _module_type_cache[key] = (mtime_ns, layout)
+    _module_type_cache.move_to_end(key)
+    if len(_module_type_cache) > _MODULE_TYPE_CACHE_MAX:
+        _module_type_cache.popitem(last=False)
+    return layout
 
 
-@functools.lru_cache(maxsize=256)
 def detect_module_type(module_path: Path) -> ModuleType | None:
-    if (module_path / ModuleType.PYTHON.entry_file).is_file():
-        return ModuleType.PYTHON
-    return None
+    module_type, _ = _module_layout(module_path)
+    return module_type
 
 
 def _strip_requirement_lines(content: str) -> list[str]:
@@ -74,7 +133,7 @@ async def check_local_module(
     if not await module_path.is_dir():
         return False, f"Failed to find path: {module_path_str}", ()
 
-    module_type = detect_module_type(Path(module_path_str))
+    module_type, has_deps = _module_layout(Path(module_path_str))
     if module_type is None:
         return False, "Failed to detect module type", ()
 
@@ -85,6 +144,8 @@ async def check_local_module(
     )
     if not valid_struct:
         return False, struct_msg, ()
+    if not has_deps:
+        return True, "", ()
 
     valid_deps, missing_deps = await asyncio.to_thread(
         _check_module_deps,
@@ -97,8 +158,6 @@ async def check_local_module(
 
 
 def _extract_python_requirements(content: str) -> tuple[str, ...]:
-    from packaging.requirements import Requirement
-
     dependencies: list[str] = []
     for requirement_line in _strip_requirement_lines(content):
         try:
@@ -150,50 +209,101 @@ def _check_module_deps(
     module_path_str: str,
     module_type: ModuleType,
 ) -> tuple[bool, tuple[str, ...]]:
-    dep_file = Path(module_path_str) / module_type.dependency_file
-    if not dep_file.is_file():
-        return True, ()
-
-    content = _read_text_file(dep_file)
+    content = _read_text_file(Path(module_path_str) / module_type.dependency_file)
     if content is None:
         return False, (f"Failed to read {module_type.dependency_file}",)
     return _check_python_deps(content)
 
 
+def invalidate_dependency_cache() -> None:
+    _installed_distributions.cache_clear()
+    _check_python_deps.cache_clear()
+
+
+@functools.cache
+def _installed_distributions() -> dict[str, importlib.metadata.Distribution]:
+    distributions: dict[str, importlib.metadata.Distribution] = {}
+    for dist in importlib.metadata.distributions():
+        name = dist.metadata["Name"]
+        if name:
+            distributions.setdefault(canonicalize_name(name), dist)
+    return distributions
+
+
+def _extra_requirements(
+    dist: importlib.metadata.Distribution,
+    extras: set[str],
+) -> list[Requirement]:
+    requirements: list[Requirement] = []
+    for requirement_line in dist.requires or ():
+        try:
+            dependency = Requirement(requirement_line)
+        except Exception:
+            continue
+        if dependency.marker is not None and any(
+            dependency.marker.evaluate({"extra": extra}) for extra in extras
+        ):
+            requirements.append(dependency)
+    return requirements
+
+
+def _unsatisfied_reason(
+    req: Requirement,
+    installed: dict[str, importlib.metadata.Distribution],
+    *,
+    check_extras: bool = True,
+) -> str | None:
+    dist = installed.get(canonicalize_name(req.name))
+    if dist is None:
+        return "failed to install"
+
+    version = dist.version
+    if req.specifier and not req.specifier.contains(
+        Version(version),
+        prereleases=True,
+    ):
+        return f"installed {version}, required {req.specifier}"
+
+    if check_extras and req.extras:
+        for dependency in _extra_requirements(dist, req.extras):
+            if _unsatisfied_reason(dependency, installed, check_extras=False):
+                return f"missing {dependency.name} for extras {sorted(req.extras)}"
+    return None
+
+
+@functools.lru_cache(maxsize=512)
 def _check_python_deps(content: str) -> tuple[bool, tuple[str, ...]]:
     requirements = _strip_requirement_lines(content)
 
     if not requirements:
         return True, ()
 
-    from packaging.requirements import Requirement
-    from packaging.version import Version
-
+    installed = _installed_distributions()
     missing: list[str] = []
     for req_str in requirements:
         try:
             req = Requirement(req_str)
-            dist = importlib.metadata.distribution(req.name)
-        except importlib.metadata.PackageNotFoundError:
-            missing.append(f"{req_str} (failed to install)")
-            continue
         except Exception as e:
             missing.append(f"{req_str} (failed to parse: {e})")
             continue
 
-        if req.specifier and not req.specifier.contains(
-            Version(dist.version),
-            prereleases=True,
-        ):
-            missing.append(
-                f"{req_str} (installed {dist.version}, required {req.specifier})",
-            )
+        if req.marker is not None and not req.marker.evaluate({"extra": ""}):
+            continue
+
+        reason = _unsatisfied_reason(req, installed)
+        if reason is not None:
+            missing.append(f"{req_str} ({reason})")
 
     if missing:
         return False, tuple(missing)
     return True, ()
 
 
+def requirements_satisfied(content: str) -> bool:
+    satisfied, _ = _check_python_deps(content)
+    return satisfied
+
+
 async def _check_module_exec(
     module_path_str: str,
     module_name: str,
@@ -204,21 +314,16 @@ async def _check_module_exec(
     return False, "Unknown module type"
 
 
-async def _check_python_module_exec(
-    module_path_str: str,
-    module_name: str,
-) -> tuple[bool, str]:
-    main_file = Path(module_path_str) / "main.py"
-    if not main_file.is_file():
-        return False, f"Failed to locate main.py in `{module_name}`."
-
+def _compile_python_main(main_file: Path, module_name: str) -> tuple[bool, str]:
     try:
         code = main_file.read_text(encoding="utf-8")
+    except (FileNotFoundError, IsADirectoryError):
+        return False, f"Failed to locate main.py in `{module_name}`."
     except OSError as e:
         return False, f"Failed to read main.py: {e}"
 
     try:
-        tree = ast.parse(code, filename=str(main_file))
+        compile(code, str(main_file), "exec", dont_inherit=True)
     except SyntaxError as e:
         pointer = " " * ((e.offset or 1) - 1) + "^"
         code_snippet = f"{e.text.strip()}\n{pointer}" if e.text else ""
@@ -226,10 +331,15 @@ async def _check_python_module_exec(
             False,
             f"Failed to compile main.py (line {e.lineno}):\n```py\n{code_snippet}\n```",
         )
-
-    try:
-        compile(tree, str(main_file), "exec", dont_inherit=True)
     except Exception as e:
         return False, f"Failed to compile: {e}"
 
     return True, ""
+
+
+async def _check_python_module_exec(
+    module_path_str: str,
+    module_name: str,
+) -> tuple[bool, str]:
+    main_file = Path(module_path_str) / "main.py"
+    return await asyncio.to_thread(_compile_python_main, main_file, module_name)
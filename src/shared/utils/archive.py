@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import functools
+import os
+import shutil
+import tarfile
+from typing import TYPE_CHECKING, BinaryIO
+
+import compression.zstd
+
+from src.shared.logger import logger
+
+if TYPE_CHECKING:
+    import pathlib
+    from collections.abc import Iterable, Iterator
+
+_ZSTD_PROGRAM = "zstd -T0 -6 --long=27"
+_ZSTD_LEVEL = 6
+_TAR_WARNING_STATUS = 1
+_TAR_BUFSIZE = 1 << 20
+
+
+@functools.cache
+def _zstd_options() -> dict[int, int]:
+    param = compression.zstd.CompressionParameter
+    _, max_workers = param.nb_workers.bounds()
+    return {
+        param.compression_level: _ZSTD_LEVEL,
+        param.nb_workers: min(os.cpu_count() or 1, max_workers),
+    }
+
+
+@contextlib.contextmanager
+def open_archive_writer(destination: BinaryIO) -> Iterator[tarfile.TarFile]:
+    with (
+        compression.zstd.ZstdFile(
+            destination,
+            mode="wb",
+            options=_zstd_options(),
+        ) as zstd_out,
+        tarfile.open(
+            mode="w|",
+            fileobj=zstd_out,
+            bufsize=_TAR_BUFSIZE,
+            copybufsize=_TAR_BUFSIZE,
+        ) as tar,
+    ):
+        yield tar
+
+
+@functools.cache
+def has_native_archiver() -> bool:
+    return shutil.which("tar") is not None and shutil.which("zstd") is not None
+
+
+async def build_native_archive(
+    root: pathlib.Path,
+    member: str,
+    *,
+    excludes: Iterable[str] = (),
+) -> bytes:
+    args = [
+        "tar",
+        f"--use-compress-program={_ZSTD_PROGRAM}",
+        "-cf",
+        "-",
+        "-C",
+        str(root),
+    ]
+    args.extend(f"--exclude={pattern}" for pattern in excludes)
+    args.append(member)
+
+    process = await asyncio.create_subprocess_exec(
+        *args,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+    )
+    data, stderr = await process.communicate()
+    detail = stderr.decode(errors="replace").strip()
+
+    if process.returncode == _TAR_WARNING_STATUS:
+        logger.warning("tar reported changed files while archiving: %s", detail)
+    elif process.returncode != 0:
+        msg = f"tar exited with status {process.returncode}: {detail}"
+        raise RuntimeError(msg)
+    logger.info("Compressed '%s' (%d bytes)", root / member, len(data))
+    return data
@@ -0,0 +1,24 @@
+from __future__ import annotations
+
+import os
+import time
+from typing import TYPE_CHECKING
+
+from src.shared.constants import FLAG_DIR
+from src.shared.logger import logger
+
+if TYPE_CHECKING:
+    import hikari
+
+
+def write_restart_flag(reason: str, executor_id: hikari.Snowflake) -> None:
+    FLAG_DIR.mkdir(exist_ok=True)
+    restart_flag = FLAG_DIR / "restart"
+    payload = b"%d %d %s" % (time.time_ns(), executor_id, reason.encode())
+    fd = os.open(restart_flag, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, payload)
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+    logger.info("Wrote restart flag to %s", restart_flag)
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import contextlib
 import datetime
+import time
 import typing
 from collections.abc import Sequence
 
@@ -14,6 +15,10 @@ if typing.TYPE_CHECKING:
     import arc
     import miru
 
+_GUILD_FOOTER_TTL: typing.Final[float] = 300.0
+
+_guild_footer_cache: dict[int, tuple[float, str, str | None]] = {}
+
 
 def _normalize_embeds(
     embeds: hikari.Embed | Sequence[hikari.Embed] | None,
@@ -94,6 +99,25 @@ async def _edit_response(
         )
 
 
+async def _guild_footer(
+    hikari_client: hikari.GatewayBot | hikari.GatewayBotAware | arc.GatewayClient,
+    guild_id: hikari.Snowflakeish,
+) -> tuple[str, str | None]:
+    key = int(guild_id)
+    cached = _guild_footer_cache.get(key)
+    if cached is not None and time.monotonic() - cached[0] < _GUILD_FOOTER_TTL:
+        return cached[1], cached[2]
+
+    cache = getattr(hikari_client, "cache", None)
+    guild: hikari.Guild | None = cache.get_guild(key) if cache is not None else None
+    if guild is None:
+        guild = await hikari_client.rest.fetch_guild(key)
+
+    icon = str(guild.make_icon_url()) if guild.icon_hash else None
+    _guild_footer_cache[key] = (time.monotonic(), guild.name, icon)
+    return guild.name, icon
+
+
 async def response(
     ctx: arc.GatewayContext | arc.Context | miru.abc.Context,
     *,
@@ -160,12 +184,8 @@ async def reply_embed(
     guild_id = getattr(ctx, "guild_id", None) if ctx else None
     if guild_id:
         try:
-            guild = await hikari_client.rest.fetch_guild(guild_id)
-            if guild:
-                embed.set_footer(
-                    text=guild.name,
-                    icon=guild.make_icon_url() if guild.icon_hash else None,
-                )
+            guild_name, guild_icon = await _guild_footer(hikari_client, guild_id)
+            embed.set_footer(text=guild_name, icon=guild_icon)
         except Exception:
             if me:
                 embed.set_footer(text=me.username, icon=me.display_avatar_url)